@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Shared Chromium server for the Universal Website Analyzer.
+
+Start this once and export the printed endpoint; every analyzer process
+then attaches to the one warm browser over CDP instead of paying a cold
+Chromium launch per process. Contexts stay isolated per fetch, so the
+only thing shared is the browser's subprocess tree (network, storage,
+GPU), which is exactly the expensive part.
+
+Usage:
+    python run_browser_server.py
+    export CHROME_CDP_ENDPOINT=<printed ws:// endpoint>
+    python universal_website_analyzer.py <url> ...
+"""
+
+import time
+
+from playwright.sync_api import sync_playwright
+
+
+def main():
+    with sync_playwright() as p:
+        server = p.chromium.launch_server(
+            headless=True,
+            args=['--no-sandbox', '--disable-dev-shm-usage']
+        )
+        print(f"Browser server running")
+        print(f"export CHROME_CDP_ENDPOINT={server.ws_endpoint}")
+        print("Press Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            print("Shutting down browser server")
+        finally:
+            server.close()
+
+
+if __name__ == "__main__":
+    main()
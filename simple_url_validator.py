@@ -6,11 +6,103 @@ Validates URLs by checking for <div class="text-center product__preview-buttons"
 import requests
 import re
 import time
-import random
 from datetime import datetime
+from operator import itemgetter
 from urllib.parse import urlparse
 
+try:
+    import brotli  # noqa: F401 - enables requests' automatic Brotli decoding
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+# Regex metacharacters: a pattern containing none of these matches as a
+# plain substring and can be counted on raw bytes
+_RE_METACHARS = frozenset('.^$*+?{}[]()|\\')
+
+# Template for a pattern-specialized native counter: the needle bytes are
+# baked into the compiled object so glibc's memmem (two-way/Boyer-Moore)
+# scans the haystack at memory bandwidth
+_C_COUNT_TEMPLATE = """\
+#define _GNU_SOURCE
+#include <stddef.h>
+#include <string.h>
+
+static const unsigned char P[] = {{{needle_bytes}}};
+#define PLEN {needle_len}
+
+size_t count(const char *h, size_t n) {{
+    size_t c = 0;
+    const char *end = h + n;
+    const char *p;
+    while (h < end && (p = memmem(h, (size_t)(end - h), P, PLEN)) != NULL) {{
+        c++;
+        h = p + PLEN;
+    }}
+    return c;
+}}
+"""
+
+
+def _build_native_counter(needle):
+    """Compile (once, cached on disk) a memmem counter specialized to the
+    pattern bytes. Returns a callable or None when no C compiler is usable."""
+    import ctypes
+    import hashlib
+    import os
+    import subprocess
+    import tempfile
+
+    try:
+        cache_dir = os.path.join(tempfile.gettempdir(), 'simple_url_validator_native')
+        os.makedirs(cache_dir, exist_ok=True)
+        digest = hashlib.sha1(needle).hexdigest()[:16]
+        so_path = os.path.join(cache_dir, f'count_{digest}.so')
+
+        if not os.path.exists(so_path):
+            c_path = os.path.join(cache_dir, f'count_{digest}.c')
+            with open(c_path, 'w') as f:
+                f.write(_C_COUNT_TEMPLATE.format(
+                    needle_bytes=', '.join(str(b) for b in needle),
+                    needle_len=len(needle)
+                ))
+            subprocess.run(
+                ['cc', '-O3', '-shared', '-fPIC', '-o', so_path, c_path],
+                check=True, capture_output=True, timeout=30
+            )
+
+        lib = ctypes.CDLL(so_path)
+        lib.count.argtypes = [ctypes.c_char_p, ctypes.c_size_t]
+        lib.count.restype = ctypes.c_size_t
+        counter = lambda body: lib.count(body, len(body))
+        # One-shot sanity check: a stale or miscompiled cached .so must
+        # fall back to the Python path, never corrupt counts
+        if counter(b'-' + needle + b'-' + needle) != 2:
+            return None
+        return counter
+    except Exception:
+        return None
+
 class SimpleURLValidator:
+    # Content types worth downloading - anything else can't contain the pattern
+    HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
     def __init__(self, pattern=None, min_count=12):
         self.min_count = min_count
         self.pattern = pattern or r'<div class="text-center product__preview-buttons">'
@@ -18,24 +110,112 @@ class SimpleURLValidator:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'br, gzip, deflate' if BROTLI_AVAILABLE else 'gzip, deflate',
             'Connection': 'keep-alive'
         }
-    
+        # Literal patterns (no regex metacharacters) can be counted on the raw
+        # response bytes, skipping the full UTF-8 decode of response.text
+        self._literal = (self.pattern.encode('utf-8').lower()
+                         if not set(self.pattern) & _RE_METACHARS else None)
+        # Pattern-specialized native scanner for literal patterns; case
+        # insensitivity comes from scanning the lowercased body
+        self._native_count = _build_native_counter(self._literal) if self._literal else None
+        # Hyperscan scans raw bytes with a SIMD-accelerated DFA - much faster
+        # than re for counting matches across large pages. Falls back silently
+        # when the library is missing or the pattern isn't Hyperscan-compatible.
+        self._hs_db = None
+        if HYPERSCAN_AVAILABLE:
+            try:
+                self._hs_db = hyperscan.Database()
+                self._hs_db.compile(
+                    expressions=[self.pattern.encode('utf-8')],
+                    ids=[0],
+                    flags=[hyperscan.HS_FLAG_CASELESS]
+                )
+            except Exception:
+                self._hs_db = None
+        # Reuse one session so HEAD + GET share the same keep-alive connection;
+        # freeze the headers on it once instead of merging a dict per request
+        self.session = requests.Session()
+        self.session.headers.clear()
+        self.session.headers.update(self.headers)
+        # Politeness is per-host: track the last request time for each host
+        # so URLs on different hosts don't wait on each other
+        self.host_interval = 1.0
+        self._host_last = {}
+
+    def _count_with_hyperscan(self, content):
+        """Count pattern matches in raw bytes using the compiled Hyperscan DB"""
+        matches = [0]
+
+        def on_match(match_id, start, end, flags, context):
+            matches[0] += 1
+
+        self._hs_db.scan(content, match_event_handler=on_match)
+        return matches[0]
+
+    def _polite_delay(self, url):
+        """Sleep only as long as needed to keep ~1 request/sec per host"""
+        host = urlparse(url).netloc.lower()
+        now = time.monotonic()
+        wait = self._host_last.get(host, 0) + self.host_interval - now
+        if wait > 0:
+            time.sleep(wait)
+        self._host_last[host] = time.monotonic()
+
+    def _should_skip_by_headers(self, url):
+        """Cheap HEAD prefilter: skip downloads that can't possibly match"""
+        try:
+            head = self.session.head(url, timeout=5, allow_redirects=True)
+        except requests.RequestException:
+            return False  # Sites without HEAD support fall through to the normal GET
+
+        # Only trust headers from a successful HEAD: a 405/403 rejection
+        # carries a small HTML error page whose Content-Length would
+        # falsely trip the too-small check below
+        if head.status_code != 200:
+            return False
+
+        content_type = head.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and content_type not in self.HTML_CONTENT_TYPES:
+            print(f"   ⏭️ SKIPPED: non-HTML Content-Type ({content_type})")
+            return True
+
+        try:
+            content_length = int(head.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = 0
+        if content_length and content_length < len(self.pattern) * self.min_count:
+            print(f"   ⏭️ SKIPPED: body too small ({content_length} bytes)")
+            return True
+
+        return False
+
     def validate_url(self, url):
         """Validate a single URL"""
         try:
             print(f"🔍 Checking: {url}")
-            
-            # Add delay to be polite
-            time.sleep(random.uniform(1.0, 2.0))
-            
-            response = requests.get(url, headers=self.headers, timeout=15)
+
+            # Add delay to be polite (per-host token bucket, not a global sleep)
+            self._polite_delay(url)
+
+            # Skip 404s, redirects to assets, binaries etc. without downloading the body
+            if self._should_skip_by_headers(url):
+                return False, 0
+
+            response = self.session.get(url, timeout=15)
             
             if response.status_code == 200:
-                html_content = response.text
-                matches = re.findall(self.pattern, html_content, re.IGNORECASE)
-                count = len(matches)
+                if self._hs_db is not None:
+                    count = self._count_with_hyperscan(response.content)
+                elif self._native_count is not None:
+                    count = self._native_count(response.content.lower())
+                elif self._literal is not None:
+                    # Byte-level count avoids decoding the whole body to str
+                    count = response.content.lower().count(self._literal)
+                else:
+                    matches = re.findall(self.pattern, response.text, re.IGNORECASE)
+                    count = len(matches)
                 
                 print(f"   Status: {response.status_code}")
                 print(f"   Pattern count: {count}")
@@ -63,22 +243,31 @@ class SimpleURLValidator:
         
         valid_urls = []
         total_processed = 0
-        
+
+        # tqdm refreshes a single in-place bar on its own timer instead of
+        # formatting and printing a progress line every N URLs
+        progress = tqdm(total=len(urls), unit='url', desc='Validating') if TQDM_AVAILABLE else None
+
         for i, url in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}] Processing URL:")
+            if progress is None:
+                print(f"\n[{i}/{len(urls)}] Processing URL:")
             is_valid, count = self.validate_url(url.strip())
-            
+
             if is_valid:
-                valid_urls.append({
-                    'url': url.strip(),
-                    'count': count
-                })
-            
+                # Plain (count, url) tuples - far lighter than per-hit dicts
+                valid_urls.append((count, url.strip()))
+
             total_processed += 1
-            
-            # Show progress every 10 URLs
-            if i % 10 == 0:
+
+            if progress is not None:
+                progress.update(1)
+                progress.set_postfix(valid=len(valid_urls), refresh=False)
+            elif i % 10 == 0:
+                # Show progress every 10 URLs
                 print(f"\n📊 Progress: {i}/{len(urls)} processed, {len(valid_urls)} valid found")
+
+        if progress is not None:
+            progress.close()
         
         print("\n" + "=" * 60)
         print(f"🎉 Validation Complete!")
@@ -97,8 +286,8 @@ class SimpleURLValidator:
                 f.write(f"# Valid URLs Found: {len(valid_urls)}\n")
                 f.write(f"# Success Rate: {(len(valid_urls)/total_processed*100):.1f}%\n")
                 f.write(f"#\n")
-                for item in sorted(valid_urls, key=lambda x: x['count'], reverse=True):
-                    f.write(f"{item['url']} (count: {item['count']})\n")
+                for count, valid_url in sorted(valid_urls, key=itemgetter(0), reverse=True):
+                    f.write(f"{valid_url} (count: {count})\n")
             print(f"✅ Results saved to: valid_urls.txt")
         else:
             # Create empty file even if no results
@@ -28,12 +28,25 @@ import json
 import re
 import time
 import random
+import itertools
+import string
+import tempfile
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from io import BytesIO
 from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Comment, SoupStrainer
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 from html import unescape
 from typing import Dict, List, Tuple, Optional, Any
+import array
+import asyncio
+import atexit
+import logging
+import threading
+import hashlib
 import os
 import sys
 from dotenv import load_dotenv
@@ -82,6 +95,1080 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# httpx gives the bypass path HTTP/2 + Brotli on a keep-alive pool
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# curl_cffi sends a real Chrome TLS ClientHello, so Cloudflare's JA3/JA4
+# fingerprint checks pass without escalating to a full browser
+try:
+    from curl_cffi import requests as curl_requests
+    CURL_CFFI_AVAILABLE = True
+except ImportError:
+    CURL_CFFI_AVAILABLE = False
+
+# orjson serializes the pattern structures interpolated into AI prompts a
+# few times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps_compact(obj: Any) -> str:
+    """Serialize obj compactly for prompt interpolation.
+
+    The tokenizer doesn't care about indentation, so pretty-printing was
+    pure overhead; orjson is used when installed, stdlib json otherwise.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+# Model used for all AI analysis calls
+OPENAI_MODEL = "gpt-4o"
+
+# Prefer lxml's C parser for all full-document parses - typically 5-10x
+# faster than the pure-Python html.parser on multi-hundred-KB pages.
+# Fragment re-parses stay on html.parser, which doesn't wrap snippets in
+# synthetic <html>/<body> elements the way lxml does
+try:
+    import lxml  # noqa: F401
+    from lxml import etree as _lxml_etree
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _lxml_etree = None
+    _HTML_PARSER = 'html.parser'
+
+
+def _iter_json_ld_payloads(html: str) -> Optional[List[Any]]:
+    """Stream JSON-LD payloads straight out of raw HTML with lxml.etree.iterparse.
+
+    The incremental parser emits each <script> as it closes and frees it
+    immediately, so no full DOM is built just to read a few ld+json blobs.
+    Returns None when lxml is unavailable so callers can fall back to soup.
+    """
+    if _lxml_etree is None:
+        return None
+
+    payloads = []
+    try:
+        parser = _lxml_etree.iterparse(
+            BytesIO(html.encode('utf-8')),
+            events=('end',), tag='script', html=True, recover=True
+        )
+        for _, element in parser:
+            if element.get('type') == 'application/ld+json' and element.text:
+                try:
+                    payloads.append(json.loads(element.text))
+                except ValueError:
+                    pass
+            element.clear()
+    except Exception:
+        return None
+    return payloads
+
+# Field-classification patterns for the single-pass DOM walk in
+# _optimize_html_for_ai; one compiled alternation scan per class string
+# instead of a Python-level substring loop per term
+_PRICE_CLASS_RE = re.compile(r'price|cost|dollar')
+_TITLE_CLASS_RE = re.compile(r'title|name|product')
+_BRAND_CLASS_RE = re.compile(r'brand|manufacturer')
+_SKU_TEXT_TERMS = ('sku:', 'model:', 'mpn:', 'part #')
+
+# Static sections of the _ai_analyze_html_for_patterns prompts, hoisted so
+# each call only allocates for the dynamic parts (URLs, sample, structured
+# data) instead of rebuilding the full multi-KB template
+_PROD_LINK_PROMPT_BODY = """
+SPECIFIC ANALYSIS INSTRUCTIONS:
+1. Focus on links that would lead to INDIVIDUAL PRODUCT PAGES (not categories, brands, or navigation)
+2. Look for URL patterns in href attributes that indicate product pages
+3. Analyze the actual HTML structure to find product containers and their links
+4. Consider the domain structure - if it's plumbersstock.com, look for .html patterns; if it's other domains, look for their specific patterns
+5. Prioritize links that appear multiple times in a listing format
+6. Exclude obvious non-product links (navigation, account, cart, brands, help, etc.)
+
+DOMAIN-SPECIFIC HINTS:
+- plumbersstock.com: Look for .html ending URLs with hyphens (e.g., /product-name-model.html)
+- Sites with /product/ or /p/ patterns: Look for those specific patterns
+- Sites with product IDs: Look for numeric or alphanumeric patterns
+- E-commerce sites: Look for links within product cards, tiles, or grid items
+"""
+
+_PROD_LINK_PROMPT_TAIL = """
+IMPORTANT: Return ONLY valid JSON with this exact structure (no markdown, no explanations):
+{
+    "product_link_patterns": [
+        {
+            "selector": "a[href$='.html'][href*='-']:not([href*='/brands/']):not([href*='/account'])",
+            "explanation": "Product links ending with .html containing hyphens, excluding non-product pages",
+            "confidence": 0.9,
+            "example_count": 5
+        }
+    ],
+    "container_selectors": [
+        {
+            "selector": ".product-item, .product-card, .item-container",
+            "explanation": "Individual product containers in the listing",
+            "confidence": 0.8
+        }
+    ],
+    "url_patterns_detected": [
+        "Pattern 1: /product-name-model.html",
+        "Pattern 2: /category/product-id"
+    ],
+    "structured_data_insights": "Insights from JSON-LD or microdata if available"
+}
+"""
+
+_PROD_FIELD_PROMPT_HEAD = """
+Analyze this HTML from a product page and identify patterns for extracting product information.
+
+Look for:
+1. Product title/name
+2. Price information
+3. Brand/manufacturer/make
+4. SKU/model number/part number/MPN
+5. Product codes (UPC, GTIN, barcode, EAN)
+6. PRIORITY: Use structured data (JSON-LD, microdata) and script tags when available for accurate patterns
+
+HTML sample:
+```html
+"""
+
+_PROD_FIELD_PROMPT_TAIL = """
+IMPORTANT: Return ONLY valid JSON with this exact structure (no markdown, no explanations):
+{
+    "field_patterns": {
+        "title": {
+            "selectors": ["h1.product-title", ".product-name"],
+            "regex_patterns": ["<h1[^>]*>([^<]+)</h1>"],
+            "json_paths": ["name", "title"] if found in structured data,
+            "confidence": 0.9
+        },
+        "price": {
+            "selectors": [".price", ".cost"],
+            "regex_patterns": ["\\$([\\d,]+\\.\\d{2})"],
+            "json_paths": ["offers.price", "price"] if found in structured data,
+            "confidence": 0.8
+        },
+        "brand": {
+            "selectors": [".brand", ".manufacturer"],
+            "regex_patterns": ["brand[\"\\s:]*([A-Za-z0-9\\s&.-]+)"],
+            "json_paths": ["brand.name", "brand", "manufacturer"] if found in structured data,
+            "confidence": 0.7
+        },
+        "sku": {
+            "selectors": [".sku", ".item-number"],
+            "regex_patterns": ["sku[\"\\s:]*([A-Za-z0-9-_\\s\\.]+)"],
+            "json_paths": ["sku", "productID"] if found in structured data,
+            "confidence": 0.7
+        },
+        "model": {
+            "selectors": [".model", ".part-number"],
+            "regex_patterns": ["model[\"\\s:]*([A-Za-z0-9-_\\s\\.]+)"],
+            "json_paths": ["mpn", "model", "partNumber"] if found in structured data,
+            "confidence": 0.7
+        },
+        "product_code": {
+            "selectors": [".upc", ".gtin", ".ean", ".ean13"],
+            "regex_patterns": ["upc[\"\\s:]*([A-Za-z0-9-_]+)", "ean[\"\\s:]*([0-9]{8}|[0-9]{13})"],
+            "json_paths": ["gtin", "upc", "gtin13", "ean", "ean13", "europeanArticleNumber"] if found in structured data,
+            "confidence": 0.6
+        }
+    },
+    "structured_data_fields": {
+        "available": true/false,
+        "source": "json-ld|microdata|other_json",
+        "direct_extraction_possible": true/false
+    }
+}
+"""
+
+# Playwright stealth configuration, frozen at import so per-URL fetches don't
+# rebuild the arg list, header dict and multi-KB init script every call
+_STEALTH_ARGS = (
+    '--no-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--exclude-switches=enable-automation',
+    '--disable-web-security',
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-translate',
+    '--hide-scrollbars',
+    '--mute-audio',
+    '--no-default-browser-check',
+    '--disable-ipc-flooding-protection',
+    '--password-store=basic',
+    '--use-mock-keychain',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+)
+
+_STEALTH_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="121", "Google Chrome";v="121"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+}
+
+# Advanced stealth script based on cloudflare_bypass.py
+_STEALTH_SCRIPT = """
+// Hide webdriver property thoroughly
+Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
+delete Object.getPrototypeOf(navigator).webdriver;
+
+// Advanced Chrome runtime spoofing
+window.chrome = {
+    app: { isInstalled: false },
+    runtime: {
+        onConnect: undefined,
+        onMessage: undefined,
+        connect: () => ({
+            onMessage: { addListener: () => {}, removeListener: () => {} },
+            postMessage: () => {},
+            disconnect: () => {}
+        })
+    }
+};
+
+// Randomize fingerprints
+Object.defineProperty(navigator, 'hardwareConcurrency', {
+    get: () => Math.floor(Math.random() * 4) + 4
+});
+
+Object.defineProperty(navigator, 'deviceMemory', {
+    get: () => [4, 8, 16][Math.floor(Math.random() * 3)]
+});
+
+// Canvas fingerprint spoofing
+const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
+HTMLCanvasElement.prototype.toDataURL = function(type) {
+    const shift = Math.floor(Math.random() * 10) - 5;
+    const canvas = this;
+    const ctx = canvas.getContext('2d');
+    if (ctx) {
+        const imageData = ctx.getImageData(0, 0, canvas.width, canvas.height);
+        for (let i = 0; i < imageData.data.length; i += 4) {
+            imageData.data[i] = Math.min(255, Math.max(0, imageData.data[i] + shift));
+        }
+        ctx.putImageData(imageData, 0, 0);
+    }
+    return originalToDataURL.apply(this, arguments);
+};
+"""
+
+# Full stealth script used by the general Playwright fetch path; the
+# shorter _STEALTH_SCRIPT above is the Cloudflare-bypass variant
+_PLAYWRIGHT_STEALTH_SCRIPT = """
+// Advanced Playwright stealth script for bypassing bot detection
+
+// Hide webdriver property
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined,
+});
+
+// Override navigator properties
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [
+        {name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer'},
+        {name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai'},
+        {name: 'Native Client', filename: 'internal-nacl-plugin'}
+    ],
+});
+
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en'],
+});
+
+Object.defineProperty(navigator, 'permissions', {
+    get: () => ({
+        query: () => Promise.resolve({ state: 'granted' })
+    }),
+});
+
+// Add chrome runtime
+window.chrome = {
+    runtime: {
+        onConnect: undefined,
+        onMessage: undefined,
+        connect: () => ({
+            onMessage: {
+                addListener: () => {},
+                removeListener: () => {}
+            },
+            postMessage: () => {},
+            disconnect: () => {}
+        })
+    },
+    app: {
+        isInstalled: false
+    }
+};
+
+// Hardware properties
+Object.defineProperty(navigator, 'hardwareConcurrency', {
+    get: () => Math.floor(Math.random() * 4) + 4, // 4-8 cores
+});
+
+Object.defineProperty(navigator, 'deviceMemory', {
+    get: () => Math.pow(2, Math.floor(Math.random() * 3) + 2), // 4, 8, or 16 GB
+});
+
+// Platform consistency
+Object.defineProperty(navigator, 'platform', {
+    get: () => 'Win32',
+});
+
+// Override automation-specific properties
+delete navigator.__proto__.webdriver;
+
+// Spoof canvas fingerprinting
+const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
+const originalGetImageData = CanvasRenderingContext2D.prototype.getImageData;
+
+HTMLCanvasElement.prototype.toDataURL = function(type) {
+    const shift = Math.floor(Math.random() * 10) - 5;
+    const canvas = this;
+    const ctx = canvas.getContext('2d');
+    const originalData = ctx.getImageData(0, 0, canvas.width, canvas.height);
+    
+    // Add slight noise
+    for (let i = 0; i < originalData.data.length; i += 4) {
+        originalData.data[i] += shift;
+        originalData.data[i + 1] += shift;
+        originalData.data[i + 2] += shift;
+    }
+    
+    ctx.putImageData(originalData, 0, 0);
+    return originalToDataURL.apply(this, arguments);
+};
+
+// Mouse movement simulation
+let mouseEvents = [];
+document.addEventListener('mousemove', (e) => {
+    mouseEvents.push({x: e.clientX, y: e.clientY, time: Date.now()});
+    if (mouseEvents.length > 100) mouseEvents.shift();
+});
+
+// Random mouse movements
+function simulateMouseMovement() {
+    const event = new MouseEvent('mousemove', {
+        clientX: Math.random() * window.innerWidth,
+        clientY: Math.random() * window.innerHeight,
+        bubbles: true
+    });
+    document.dispatchEvent(event);
+}
+
+// Simulate human-like behavior
+setTimeout(() => {
+    for (let i = 0; i < 5; i++) {
+        setTimeout(simulateMouseMovement, Math.random() * 2000);
+    }
+}, Math.random() * 1000);
+
+// Override toString methods
+navigator.webdriver = undefined;
+Object.defineProperty(Object.getPrototypeOf(navigator), 'webdriver', {
+    set: undefined,
+    enumerable: false,
+    configurable: false
+});
+"""
+
+# Per-context fingerprint randomization; only the numeric slots vary, so
+# the script body is parsed by string.Template once at import time
+_FINGERPRINT_TEMPLATE = string.Template("""
+// Randomize screen properties
+Object.defineProperty(screen, 'width', {
+    get: () => $width
+});
+Object.defineProperty(screen, 'height', {
+    get: () => $height
+});
+Object.defineProperty(screen, 'availWidth', {
+    get: () => $width
+});
+Object.defineProperty(screen, 'availHeight', {
+    get: () => $avail_height
+});
+
+// Randomize WebGL properties
+const getParameter = WebGLRenderingContext.prototype.getParameter;
+WebGLRenderingContext.prototype.getParameter = function(parameter) {
+    if (parameter === 37445) {
+        return 'Intel Inc.';
+    }
+    if (parameter === 37446) {
+        return 'Intel(R) Iris(TM) Graphics $graphics_number';
+    }
+    return getParameter.call(this, parameter);
+};
+""")
+
+# Selenium-side stealth scripts and launch arguments, interned once at
+# import instead of rebuilt per driver
+_SELENIUM_STEALTH_SCRIPT = """
+// Advanced stealth script for bypassing bot detection
+
+// Hide webdriver property more thoroughly
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined,
+});
+
+// Delete webdriver property from prototype
+delete Object.getPrototypeOf(navigator).webdriver;
+
+// Override automation flags
+Object.defineProperty(navigator, 'permissions', {
+    get: () => ({
+        query: () => Promise.resolve({ state: 'granted' })
+    }),
+});
+
+// Spoof Chrome runtime
+window.chrome = {
+    app: {
+        isInstalled: false,
+        InstallState: {
+            DISABLED: 'disabled',
+            INSTALLED: 'installed',
+            NOT_INSTALLED: 'not_installed'
+        },
+        RunningState: {
+            CANNOT_RUN: 'cannot_run',
+            READY_TO_RUN: 'ready_to_run',
+            RUNNING: 'running'
+        }
+    },
+    runtime: {
+        onConnect: null,
+        onMessage: null,
+        onStartup: null,
+        onInstalled: null,
+        onSuspend: null,
+        onSuspendCanceled: null,
+        onUpdateAvailable: null,
+        id: 'fake-extension-id'
+    }
+};
+
+// Spoof plugins
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [1, 2, 3, 4, 5],
+});
+
+// Spoof languages
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-US', 'en'],
+});
+
+// Spoof platform
+Object.defineProperty(navigator, 'platform', {
+    get: () => 'Win32',
+});
+
+// Mock getParameter function for WebGL
+const getParameter = WebGLRenderingContext.getParameter;
+WebGLRenderingContext.prototype.getParameter = function(parameter) {
+    if (parameter === 37445) {
+        return 'Intel Inc.';
+    }
+    if (parameter === 37446) {
+        return 'Intel(R) Iris(TM) Graphics 6100';
+    }
+    return getParameter(parameter);
+};
+
+// Mock getBattery
+navigator.getBattery = () => Promise.resolve({
+    charging: true,
+    chargingTime: 0,
+    dischargingTime: Infinity,
+    level: 1
+});
+
+// Override Date to be consistent
+Date.prototype.getTimezoneOffset = () => -new Date().getTimezoneOffset();
+
+// Spoof screen properties
+Object.defineProperty(screen, 'colorDepth', {get: () => 24});
+Object.defineProperty(screen, 'pixelDepth', {get: () => 24});
+
+// Remove automation indicators
+['__driver_evaluate', '__webdriver_evaluate', '__selenium_evaluate', '__fxdriver_evaluate', '__driver_unwrapped', '__webdriver_unwrapped', '__selenium_unwrapped', '__fxdriver_unwrapped', '_Selenium_IDE_Recorder', '_selenium', 'calledSelenium', '_WEBDRIVER_ELEM_CACHE', 'ChromeDriverw', 'driver-evaluate', 'webdriver-evaluate', 'selenium-evaluate', 'webdriverCommand', 'webdriver-evaluate-response'].forEach(prop => {
+    delete window[prop];
+});
+
+// Mock notification permission
+Object.defineProperty(Notification, 'permission', {
+    get: () => 'default'
+});
+
+console.log('Advanced stealth script loaded');
+"""
+
+_SELENIUM_BASIC_STEALTH = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+delete Object.getPrototypeOf(navigator).webdriver;
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+"""
+
+_SELENIUM_STEALTH_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-web-security',
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--hide-scrollbars',
+    '--mute-audio',
+    '--no-default-browser-check',
+    '--disable-ipc-flooding-protection',
+    '--password-store=basic',
+    '--use-mock-keychain',
+    '--disable-background-networking',
+    '--disable-features=VizDisplayCompositor,TranslateUI',
+    '--disable-hang-monitor',
+    '--disable-prompt-on-repost',
+    '--disable-component-update',
+    '--no-first-run',
+    '--disable-logging',
+    '--disable-breakpad',
+    '--disable-client-side-phishing-detection',
+    '--disable-crash-reporter',
+    '--disable-extensions-file-access-check',
+    '--disable-extensions-http-throttling',
+)
+
+# Cheap challenge probe: pulling driver.page_source serializes the whole
+# DOM over CDP on every poll; the title plus the first 500 chars of body
+# text is enough to spot a challenge page and ~100x less to transfer
+_CHALLENGE_PROBE_JS = (
+    "return (document.title + ' ' + "
+    "(document.body ? document.body.innerText.slice(0, 500) : ''))"
+    ".toLowerCase();"
+)
+
+# Phrases (beyond the Cloudflare one) that mark a still-resolving
+# challenge/interstitial page
+_CHALLENGE_PATTERNS = ("please wait", "loading", "redirecting")
+
+_SELENIUM_BASIC_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-web-security',
+    '--disable-extensions',
+    '--disable-plugins',
+)
+
+# In-page human-behavior animation: the same randomized scroll/settle
+# sequence the Python loop used to drive call-by-call, now performed
+# entirely inside the page so one evaluate covers it
+_HUMAN_BEHAVIOR_JS = """async () => {
+    const sleep = ms => new Promise(r => setTimeout(r, ms));
+    const scrolls = 1 + Math.floor(Math.random() * 3);
+    for (let i = 0; i < scrolls; i++) {
+        const distance = 200 + Math.floor(Math.random() * 400);
+        window.scrollBy(0, distance);
+        await sleep(500 + Math.random() * 1000);
+        if (Math.random() > 0.7) {
+            window.scrollBy(0, -distance / 2);
+            await sleep(300 + Math.random() * 500);
+        }
+    }
+    window.scrollTo(0, 0);
+}"""
+
+# Long-lived Playwright worker run in a subprocess (see
+# _fetch_playwright_subprocess): one interpreter + one browser per mode for
+# the whole crawl, one fresh context per URL, JSON lines over stdin/stdout
+_PW_WORKER_SCRIPT = """
+import json
+import sys
+
+from playwright.sync_api import sync_playwright
+
+# Ad-tech/analytics hosts that keep long-poll connections open; blocking
+# them speeds up the load itself and trims bandwidth
+AD_DOMAINS = (
+    'googletagmanager.com', 'google-analytics.com', 'doubleclick.net',
+    'connect.facebook.net', 'criteo.com', 'hotjar.com', 'clarity.ms',
+)
+
+
+def _route_filter(route):
+    if any(domain in route.request.url for domain in AD_DOMAINS):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def main():
+    pw = sync_playwright().start()
+    browsers = {}
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+        except ValueError:
+            continue
+        if req.get('cmd') == 'quit':
+            break
+        result = {'html': None}
+        try:
+            headless = bool(req.get('headless', True))
+            browser = browsers.get(headless)
+            if browser is None:
+                browser = pw.chromium.launch(
+                    headless=headless,
+                    args=['--no-sandbox', '--disable-setuid-sandbox']
+                )
+                browsers[headless] = browser
+            context = browser.new_context(
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            )
+            context.route('**/*', _route_filter)
+            try:
+                page = context.new_page()
+                # DOM ready plus a short wait for the first content-bearing
+                # element; networkidle virtually never fires on tracker-heavy
+                # shops, so waiting for it just burned its timeout plus the
+                # fixed sleeps that followed
+                page.goto(req['url'], wait_until='domcontentloaded', timeout=15000)
+                try:
+                    page.wait_for_selector(
+                        "a[href*='product'], [data-product], main, nav",
+                        timeout=3000)
+                except Exception:
+                    pass
+                result['html'] = page.content()
+            finally:
+                context.close()
+        except Exception as e:
+            result['error'] = str(e)
+        sys.stdout.write(json.dumps(result) + '\n')
+        sys.stdout.flush()
+    for browser in browsers.values():
+        try:
+            browser.close()
+        except Exception:
+            pass
+    pw.stop()
+
+
+main()
+"""
+
+# Cloudflare challenge markers: one case-insensitive DFA pass over the page
+# instead of lowercasing the whole DOM string per substring test
+_CF_CHALLENGE_RE = re.compile(r'cf-ray|checking your browser', re.IGNORECASE)
+
+# Static Playwright launch/context inputs, hoisted so the fetch path picks
+# references instead of rebuilding the literals for every URL
+_FAST_BROWSER_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+)
+
+_STEALTH_BROWSER_ARGS = (
+    '--no-sandbox',
+    '--disable-blink-features=AutomationControlled',
+    '--exclude-switches=enable-automation',
+    '--disable-web-security',
+    '--disable-extensions',
+    '--disable-plugins',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--hide-scrollbars',
+    '--mute-audio',
+    '--no-default-browser-check',
+    '--disable-ipc-flooding-protection',
+    '--password-store=basic',
+    '--use-mock-keychain',
+    '--disable-dev-shm-usage',
+    '--disable-field-trial-config',
+    '--no-first-run',
+    '--disable-background-networking',
+    '--disable-client-side-phishing-detection',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-domain-reliability',
+    '--disable-features=TranslateUI',
+    '--force-color-profile=srgb',
+    '--metrics-recording-only',
+    '--safebrowsing-disable-auto-update',
+)
+
+_VIEWPORTS = (
+    {"width": 1920, "height": 1080},
+    {"width": 1366, "height": 768},
+    {"width": 1536, "height": 864},
+    {"width": 1440, "height": 900},
+    {"width": 1600, "height": 900},
+)
+
+_TIMEZONES = (
+    "America/New_York",
+    "America/Chicago",
+    "America/Denver",
+    "America/Los_Angeles",
+    "Europe/London",
+    "Europe/Berlin",
+)
+
+_LOCALES = ("en-US", "en-GB", "en-CA")
+
+# Static part of the stealth context's extra_http_headers; only the
+# randomized Sec-Ch-Ua fields are merged over this per context
+_STEALTH_CONTEXT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+    "DNT": "1",
+}
+
+@lru_cache(maxsize=None)
+def _init_script_path(script: str, suffix: str = '.js') -> str:
+    """Write a static script to a temp file once per process.
+
+    Playwright's add_init_script(path=...) reads the file itself, so the
+    script bytes cross the CDP bridge from one on-disk source instead of
+    being re-serialized from Python for every context.
+    """
+    handle = tempfile.NamedTemporaryFile('w', suffix=suffix, delete=False,
+                                         encoding='utf-8')
+    with handle:
+        handle.write(script)
+
+    def _cleanup(path=handle.name):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    atexit.register(_cleanup)
+    return handle.name
+
+
+# Optional shared-browser endpoint: when set, the browser pool attaches to
+# one externally-run Chromium (ws://... from launch_server via
+# run_browser_server.py, or http://host:port for --remote-debugging-port)
+# instead of launching per process
+_CDP_ENDPOINT = os.environ.get('CHROME_CDP_ENDPOINT')
+
+# Minimum spacing between fetches against one host (seconds); enforced by
+# the per-host token bucket in _fetch_with_requests
+_HOST_MIN_INTERVAL = 1.0
+
+# Identifying attributes probed when deriving a CSS selector for an element
+_SELECTOR_ID_ATTRS = ('id', 'data-id', 'data-product')
+
+# Proven-working user agents for Playwright contexts; built once as an
+# immutable tuple instead of a fresh list per call
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/120.0.0.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+)
+
+# Protection-page signatures compiled into one alternation so detection is a
+# single C-level scan instead of one substring pass per indicator
+_PROTECTION_SIGNATURES = (
+    'incapsula incident id', 'imperva', 'cloudflare ray id',
+    'checking your browser before', 'ddos protection by',
+    'please wait while we', 'security check in progress',
+    'bot detection', 'access denied by',
+    'solve this challenge', 'complete the captcha',
+    'human verification required', 'ray id:',
+    'attention required! cloudflare', 'checking if the site connection is secure',
+    'enable javascript and cookies to continue',
+    'cdn-cgi/challenge-platform',  # More specific cloudflare detection (not just cloudflare.com)
+)
+_PROTECTION_SIG_RE = re.compile('|'.join(re.escape(sig) for sig in _PROTECTION_SIGNATURES),
+                                re.IGNORECASE)
+
+# Compiled fallback checks for ambiguous wording on short pages
+_BLOCKED_BY_RE = re.compile(r'blocked by', re.IGNORECASE)
+_BLOCKED_CONTEXT_RE = re.compile(r'cloudflare|ddos|security|protection', re.IGNORECASE)
+_SHORT_PROTECTION_RE = re.compile(r'access denied|forbidden|unauthorized', re.IGNORECASE)
+
+# Byte-level variant for requests responses: scanning response.content skips
+# the charset-detection decode and the lowercased copy of the body
+_CFRAY_BYTES_RE = re.compile(rb'cf-ray', re.IGNORECASE)
+
+# E-commerce platform fingerprints, compiled into one named-group
+# alternation so the C regex engine spots every platform in a single pass
+# over the raw HTML instead of ~25 Python substring scans of a .lower()
+# copy
+_PLATFORM_PATTERNS = {
+    'shopify': ('shopify', 'myshopify.com', 'shopifycdn.com', '__st ='),
+    'woocommerce': ('woocommerce', 'wp-content/plugins/woocommerce'),
+    'magento': ('magento', 'mage/', 'var FORM_KEY'),
+    'bigcommerce': ('bigcommerce', 'cdn.bcapp.dev'),
+    'prestashop': ('prestashop', 'ps_'),
+    'opencart': ('index.php?route=', 'catalog/view/theme/'),
+    'squarespace': ('squarespace.com', 'static1.squarespace.com'),
+    'wix': ('wix.com', 'static.wixstatic.com')
+}
+_PLATFORM_RE = re.compile(
+    '|'.join(
+        '(?P<%s>%s)' % (name, '|'.join(re.escape(p) for p in patterns))
+        for name, patterns in _PLATFORM_PATTERNS.items()),
+    re.IGNORECASE)
+
+# Ancestor markers that qualify an anchor as navigation - the same set the
+# old 'nav a' / 'header a' / '.navigation a' / ... selectors matched
+_NAV_TAGS = ('nav', 'header')
+_NAV_CLASSES = ('navigation', 'nav', 'menu', 'navbar')
+_NAV_IDS = ('navigation', 'nav')
+
+# Keywords that indicate product categories
+_CATALOG_KEYWORDS = (
+    'product', 'category', 'catalog', 'shop', 'store',
+    'collection', 'browse', 'taxonomy', 'department'
+)
+
+
+def _is_nav_anchor(link) -> bool:
+    """True if the anchor sits inside a navigation-looking ancestor"""
+    for parent in link.parents:
+        name = getattr(parent, 'name', None)
+        if not name:
+            continue
+        if name in _NAV_TAGS:
+            return True
+        if any(cls in _NAV_CLASSES for cls in (parent.get('class') or ())):
+            return True
+        if parent.get('id') in _NAV_IDS:
+            return True
+    return False
+
+# User-supplied HTML snippets only ever get queried for these tags, so the
+# strainer skips everything else at parse time
+_USER_HTML_STRAINER = SoupStrainer(['a', 'h1', 'h2', 'h3', 'span', 'div', 'p'])
+
+# Field-detection strategies for user-supplied HTML, built once at import.
+# Class terms are substring matches against the joined class string, so each
+# strategy carries a compiled alternation instead of a per-term Python loop.
+_FIELD_STRATEGIES = {
+    'Product_Title': [
+        {'tags': ('h1', 'h2', 'h3'), 'class_re': re.compile(r'title|name|product')},
+        {'class_re': re.compile(r'product-title|product-name|item-title|title')},
+    ],
+    'Price': [
+        {'class_re': re.compile(r'price|cost|amount')},
+        {'tags': ('span', 'div'), 'content_re': re.compile(r'[$€£]\d+')},
+    ],
+    'Brand': [
+        {'class_re': re.compile(r'brand|manufacturer|make')},
+        {'tags': ('span', 'div'), 'class_re': re.compile(r'brand')},
+    ],
+}
+
+
+def _is_comment(text) -> bool:
+    """string= predicate for comment removal - a module-level function so the
+    closure isn't rebuilt on every _optimize_html_for_ai call"""
+    return isinstance(text, Comment)
+
+# GTIN check-digit weights (3/1 alternating from the right, check digit
+# excluded), precomputed per valid code length
+_GTIN_WEIGHTS = {
+    length: tuple(3 if (length - 2 - i) % 2 == 0 else 1 for i in range(length - 1))
+    for length in (8, 12, 13, 14)
+}
+
+
+@lru_cache(maxsize=1024)
+def _split_json_path(path: str) -> Tuple[str, ...]:
+    """Split a dot-notation JSON path once (the same handful of candidate
+    paths gets walked for every product)"""
+    return tuple(path.split('.'))
+
+
+@lru_cache(maxsize=4096)
+def _tag_text_regex(tag: str, text: str) -> str:
+    """Build (and reuse) the literal-match regex string for a tag/text pair.
+
+    Similar product tiles repeat the same tag and text across strategies,
+    so the escape + format work is memoized rather than redone per element.
+    """
+    return f'<{tag}[^>]*>\\s*({re.escape(text)})\\s*</{tag}>'
+
+
+def _walk_json_path(data: Any, path: str) -> Any:
+    """Walk a dot-notation path through parsed JSON.
+
+    Module-level, fully annotated and free of soup/self references so an
+    AOT compiler (mypyc) can take it as-is if this inner loop ever warrants
+    a compiled extension; exact type checks keep the interpreted version
+    fast meanwhile.
+    """
+    current: Any = data
+    for key in _split_json_path(path):
+        if type(current) is dict:
+            current = current.get(key)
+        elif type(current) is list and current and type(current[0]) is dict:
+            # If it's a list, try the first item
+            current = current[0].get(key)
+        else:
+            return None
+        if current is None:
+            return None
+    return current
+
+
+@lru_cache(maxsize=4096)
+def _parse_url(url: str):
+    """Cached urlparse - the retry and bypass paths re-parse the same URL
+    several times per fetch, and ParseResult is immutable so sharing is safe"""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=256)
+def _domain_from_url(url: str) -> str:
+    """Extract the lowercased domain from a URL (memoized - an analysis run
+    re-derives the same handful of domains constantly)"""
+    try:
+        return _parse_url(url).netloc.lower()
+    except Exception:
+        return url
+
+
+@lru_cache(maxsize=256)
+def _site_name_from_domain(domain: str) -> str:
+    """Derive a clean site name from a domain (memoized)"""
+    # Remove www. prefix
+    if domain.startswith('www.'):
+        domain = domain[4:]
+
+    # Remove common TLDs and get main name
+    domain_parts = domain.split('.')
+    if len(domain_parts) >= 2:
+        # Take the main domain name (before the TLD)
+        site_name = domain_parts[0]
+    else:
+        site_name = domain
+
+    # Replace any remaining special characters with underscores
+    return site_name.replace('-', '_').replace('.', '_')
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_json_objects(s: str, limit: int = 3) -> List[Dict]:
+    """Parse JSON objects straight out of mixed JS/JSON text.
+
+    raw_decode at each candidate '{' extracts and validates in one step -
+    no intermediate slice extraction, no separate json.loads pass, and the
+    decoder tells us where each object ends so the scan can jump past it.
+    """
+    objects = []
+    idx = s.find('{')
+    while idx != -1 and len(objects) < limit:
+        try:
+            obj, end = _JSON_DECODER.raw_decode(s, idx)
+        except ValueError:
+            idx = s.find('{', idx + 1)
+            continue
+        if isinstance(obj, dict) and obj:
+            objects.append(obj)
+        idx = s.find('{', end)
+    return objects
+
+
+def _skeletonize(html: str, max_chars: int = 4000) -> str:
+    """Compress HTML to a tag/class/id skeleton for selector prompts.
+
+    Selector generation only needs element structure, not page copy, so
+    eliding text to a short stub cuts prompt size (and input tokens)
+    several-fold compared to feeding a raw prefix slice of the page.
+    """
+    try:
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        parts = []
+        size = 0
+        for el in soup.find_all(True):
+            if el.name in ('script', 'style', 'noscript', 'head', 'meta', 'link'):
+                continue
+            attrs = ''
+            if el.get('class'):
+                attrs += f' class="{" ".join(el["class"])[:40]}"'
+            if el.get('id'):
+                attrs += f' id="{str(el["id"])[:40]}"'
+            text = (el.find(string=True, recursive=False) or '').strip()
+            if len(text) > 30:
+                text = text[:30] + '…'
+            line = f"<{el.name}{attrs}>{text}"
+            parts.append(line)
+            size += len(line) + 1
+            if size >= max_chars:
+                break
+        return '\n'.join(parts)
+    except Exception:
+        return html[:max_chars]
+
+
+def _extract_first_json(s: str):
+    """Pull the first JSON value ({...} or [...]) out of an AI response.
+
+    Model output often wraps the JSON in markdown fences or prose; a single
+    raw_decode from the first opening bracket parses it in one pass instead
+    of the find/rfind/slice/loads dance, and trailing junk is ignored for
+    free because the decoder stops at the value's end.
+    """
+    for idx, ch in enumerate(s):
+        if ch in '{[':
+            try:
+                return _JSON_DECODER.raw_decode(s, idx)[0]
+            except ValueError:
+                return None
+    return None
+
+
+# Per-attempt fetch diagnostics go through the module logger: %s args
+# defer formatting until a handler actually wants DEBUG records, where
+# the old prints formatted and flushed on every attempt
+_log = logging.getLogger(__name__)
+
 
 def print_success(message):
     """Print success message in green"""
@@ -104,47 +1191,108 @@ def print_highlight(message):
     print(f"{Fore.MAGENTA}{Style.BRIGHT}{message}{Style.RESET_ALL}")
 
 
+# Approach codes for the packed memory table; lane value 0 means unknown
+_APPROACH_CODES = ('requests', 'playwright', 'selenium', 'playwright_subprocess')
+
+
+def _fnv1a64(text: str) -> int:
+    """64-bit FNV-1a hash (stable across runs, unlike built-in hash())"""
+    h = 0xCBF29CE484222325
+    for byte in text.encode('utf-8'):
+        h = ((h ^ byte) * 0x100000001B3) & 0xFFFFFFFFFFFFFFFF
+    return h
+
+
 class ApproachMemory:
-    """Manages successful approach memory across different validation methods"""
-    
-    def __init__(self, memory_file='approach_memory.json'):
+    """Manages successful approach memory across different validation methods.
+
+    Backed by a fixed 65536-slot uint64 table with 3-bit lanes (21 domains
+    per word) instead of a per-domain dict, so memory stays at 512 KB no
+    matter how many domains are seen. A lane collision simply overwrites
+    the older domain's hint, which costs at most one wasted fetch attempt;
+    remembered approaches are hints, never correctness.
+    """
+
+    _TABLE_SLOTS = 65536
+    _LANES_PER_WORD = 21  # 3-bit lanes packed into each uint64
+
+    # validate.py's ApproachMemory owns this flat domain -> approach file;
+    # it is only ever read here (to seed a fresh packed table), never
+    # written, so the validator keeps its own memory intact
+    _LEGACY_MEMORY_FILE = 'approach_memory.json'
+
+    def __init__(self, memory_file='approach_memory_packed.json'):
         self.memory_file = memory_file
-        self.memory = self._load_memory()
-    
-    def _load_memory(self) -> Dict[str, str]:
-        """Load approach memory from file"""
+        self.table = array.array('Q', bytes(8 * self._TABLE_SLOTS))
+        # Records only mutate the in-memory table; the file is rewritten
+        # once at exit (or on explicit save_memory) instead of per record
+        self._dirty = False
+        self._load_memory()
+        atexit.register(self._flush_if_dirty)
+
+    def _slot_lane(self, domain: str) -> Tuple[int, int]:
+        h = _fnv1a64(domain)
+        return h & (self._TABLE_SLOTS - 1), (h >> 16) % self._LANES_PER_WORD
+
+    def _load_memory(self):
+        """Load the packed table, seeding it from validate.py's flat file
+        when no packed file exists yet"""
         try:
             if os.path.exists(self.memory_file):
-                with open(self.memory_file, 'r') as f:
-                    return json.load(f)
+                with open(self.memory_file, 'rb') as f:
+                    data = json.loads(f.read())
+                for slot, word in data.get('words', {}).items():
+                    self.table[int(slot)] = word
+            elif os.path.exists(self._LEGACY_MEMORY_FILE):
+                # One-time seed from the validator's dict; _dirty stays set
+                # so the packed file is written at exit
+                with open(self._LEGACY_MEMORY_FILE, 'rb') as f:
+                    legacy = json.loads(f.read())
+                for domain, approach in legacy.items():
+                    self.record_successful_approach(domain, approach)
         except Exception as e:
             print_warning(f"WARNING: Could not load approach memory: {e}")
-        return {}
-    
+
     def save_memory(self):
-        """Save approach memory to file"""
+        """Save approach memory to file (atomic tmp-file + rename)"""
         try:
-            with open(self.memory_file, 'w') as f:
-                json.dump(self.memory, f, indent=2)
+            words = {str(i): w for i, w in enumerate(self.table) if w}
+            tmp_file = self.memory_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump({'format': 'packed', 'words': words}, f,
+                          separators=(',', ':'))
+            os.replace(tmp_file, self.memory_file)
+            self._dirty = False
         except Exception as e:
             print_warning(f"WARNING: Could not save approach memory: {e}")
-    
+
+    def _flush_if_dirty(self):
+        """Flush unsaved records to disk (registered with atexit)"""
+        if self._dirty:
+            self.save_memory()
+
     def get_successful_approach(self, domain: str) -> Optional[str]:
         """Get the successful approach for a domain"""
-        return self.memory.get(domain)
-    
+        slot, lane = self._slot_lane(domain)
+        code = (self.table[slot] >> (3 * lane)) & 7
+        if 1 <= code <= len(_APPROACH_CODES):
+            return _APPROACH_CODES[code - 1]
+        return None
+
     def record_successful_approach(self, domain: str, approach: str):
         """Record a successful approach for a domain"""
-        self.memory[domain] = approach
-        self.save_memory()
-    
+        try:
+            code = _APPROACH_CODES.index(approach) + 1
+        except ValueError:
+            return
+        slot, lane = self._slot_lane(domain)
+        shift = 3 * lane
+        self.table[slot] = (self.table[slot] & ~(7 << shift)) | (code << shift)
+        self._dirty = True
+
     def get_domain_from_url(self, url: str) -> str:
         """Extract domain from URL"""
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc.lower()
-        except:
-            return url
+        return _domain_from_url(url)
 
 class UniversalWebsiteAnalyzer:
     """Universal website analyzer for e-commerce scraping configuration"""
@@ -171,6 +1319,25 @@ class UniversalWebsiteAnalyzer:
         
         # Always use proxies (Webshare rotating proxy only)
         self.use_proxies = use_proxies
+
+        # Persistent pooled sessions: homepage -> catalog -> product hits on
+        # the same host reuse one TCP+TLS connection instead of handshaking
+        # per request. The proxy session carries the Webshare credentials so
+        # callers don't rebuild a proxies dict per call.
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=3))
+        self.session.mount('https://', HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=3))
+
+        self.proxy_session = requests.Session()
+        self.proxy_session.mount('http://', HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=3))
+        self.proxy_session.mount('https://', HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=3))
+        # Per-request proxy mapping for _fetch_with_requests, built once
+        # instead of re-splitting the server string on every call
+        self._requests_proxy_dict = None
+        if use_proxies:
+            proxy_url = f"http://{self.webshare_proxy['username']}:{self.webshare_proxy['password']}@{self.webshare_proxy['server'].removeprefix('http://')}"
+            self.proxy_session.proxies = {'http': proxy_url, 'https': proxy_url}
+            self._requests_proxy_dict = {'http': proxy_url, 'https': proxy_url}
         
         # Load proxies - Webshare rotating proxy only
         self.proxies = []
@@ -190,7 +1357,85 @@ class UniversalWebsiteAnalyzer:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
         ]
-        
+
+        # Pre-shuffled UA cycle instead of per-call random.choice, plus a
+        # private Random instance for jitter - skips the random module's
+        # RLock when racing fetch attempts run in threads
+        self._rng = random.Random()
+        self._ua_cycle = itertools.cycle(
+            random.sample(self.user_agents, len(self.user_agents)))
+
+        # Extra same-origin security headers merged over the random set by
+        # _fetch_with_requests approach 3; the base_url never changes, so the
+        # dict is built once here rather than per fetch
+        self._security_header_extras = {
+            'Referer': self.base_url,
+            'Origin': self.base_url,
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'same-origin',
+            'Sec-Fetch-User': '?1'
+        }
+
+        # Last-known-good _fetch_with_requests approach index per host, the
+        # requests-side counterpart of approach_memory for Playwright
+        self._req_approach_memory = {}
+
+        # Persistent Playwright worker subprocess, spawned on first
+        # subprocess-fallback fetch (see _fetch_playwright_subprocess)
+        self._pw_worker = None
+        atexit.register(self._stop_pw_worker)
+
+        # Per-host politeness bucket: host -> next allowed fetch timestamp
+        # (time.monotonic). A fetch sleeps only when it would exceed the
+        # budget, so pacing amortizes across URLs instead of a fixed sleep
+        # before every attempt
+        self._host_next_allowed = {}
+
+        # Shared HTML pre-digest cache so product_links and product_fields
+        # analyses of the same page reuse one preprocessing pass
+        self._html_digest_cache = {}
+
+        # AI completions keyed by request hash (see _ai_chat). Backed by a
+        # JSON sidecar in the ApproachMemory style so identical prompts are
+        # free across runs, not just within one
+        self._ai_cache_file = 'ai_response_cache.json'
+        self._ai_response_cache = self._load_ai_cache()
+        self._ai_cache_dirty = False
+        atexit.register(self._flush_ai_cache)
+
+        # HTTP/2 client for the cf-ray bypass: Cloudflare edges negotiate h2
+        # and Brotli, so retries reuse one multiplexed connection and bodies
+        # shrink 20-30% vs gzip. Falls back to the pooled requests session.
+        self._http2_client = None
+        if HTTPX_AVAILABLE:
+            try:
+                self._http2_client = httpx.Client(
+                    http2=True,
+                    # Only advertise encodings httpx can decode at our pinned
+                    # floor (zstd needs httpx>=0.28 plus the zstandard pkg)
+                    headers={'accept-encoding': 'br, gzip'},
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_keepalive_connections=32)
+                )
+            except Exception:
+                self._http2_client = None
+
+        # Chrome-impersonating session (preferred for the bypass when
+        # available): passes TLS-fingerprint checks that block plain Python
+        # clients, keeping far more pages off the 100x-costlier browser path.
+        # Its cookie jar persists across calls like the other sessions.
+        self._impersonate_session = None
+        if CURL_CFFI_AVAILABLE:
+            try:
+                self._impersonate_session = curl_requests.Session(impersonate="chrome124")
+            except Exception:
+                self._impersonate_session = None
+
+        # Hosts whose Cloudflare cookies we already hold - lets the bypass
+        # skip the homepage/catalog warmup round trips on repeat fetches
+        self._cf_warm_hosts = set()
+
         # Initialize approach memory
         self.approach_memory = ApproachMemory()
         self.deep_analysis = deep_analysis
@@ -206,49 +1451,52 @@ class UniversalWebsiteAnalyzer:
             'recommended_config': {}
         }
         
-        # Initialize OpenAI
-        if self.use_ai:
-            self._setup_openai()
+        # OpenAI client is created lazily on first AI use (see
+        # _ensure_openai_client) so non-AI runs skip dotenv + client setup
     
+    # Valid GTIN/UPC lengths: 8, 12, 13, 14 digits
+    _GTIN_LENGTHS = frozenset({8, 12, 13, 14})
+
     def _validate_gtin_upc(self, code: str) -> bool:
         """Validate if a code is a valid GTIN/UPC format"""
         if not code or not isinstance(code, str):
             return False
-        
-        # Remove any non-digit characters
-        clean_code = ''.join(filter(str.isdigit, code))
-        
-        # Valid GTIN/UPC lengths: 8, 12, 13, 14 digits
-        valid_lengths = [8, 12, 13, 14]
-        if len(clean_code) not in valid_lengths:
+
+        # Fast path: scraped codes are usually already pure digits, so skip
+        # the filter()/join allocation entirely
+        if code.isdigit():
+            clean_code = code
+        else:
+            # Remove any non-digit characters
+            clean_code = ''.join(filter(str.isdigit, code))
+
+        if len(clean_code) not in self._GTIN_LENGTHS:
             return False
-        
+
         # Check if all zeros (invalid)
-        if clean_code == '0' * len(clean_code):
+        if set(clean_code) == {'0'}:
             return False
-        
+
         # Validate check digit using GTIN algorithm
         return self._validate_gtin_check_digit(clean_code)
     
     def _validate_gtin_check_digit(self, code: str) -> bool:
         """Validate GTIN check digit using the standard algorithm"""
         try:
+            weights = _GTIN_WEIGHTS.get(len(code))
+            if weights is None:
+                return False
+
             # Convert to list of integers
             digits = [int(d) for d in code]
-            
-            # Calculate check digit using GTIN algorithm
-            check_sum = 0
-            
-            # For GTIN, we start from the rightmost digit (excluding check digit)
-            # and alternate weights 3 and 1 from right to left
-            for i in range(len(digits) - 1):
-                position_from_right = len(digits) - 2 - i  # Position from right (0-based)
-                weight = 3 if position_from_right % 2 == 0 else 1  # Odd positions get weight 3
-                check_sum += digits[i] * weight
-            
+
+            # Weighted sum over the precomputed 3/1 weights (check digit
+            # excluded); zip stops at the shorter weights tuple
+            check_sum = sum(d * w for d, w in zip(digits, weights))
+
             # Calculate the check digit
             calculated_check = (10 - (check_sum % 10)) % 10
-            
+
             # Compare with the actual check digit
             return calculated_check == digits[-1]
         except (ValueError, IndexError):
@@ -272,44 +1520,111 @@ class UniversalWebsiteAnalyzer:
             if not api_key:
                 raise RuntimeError("OPENAI_API_KEY is not set")
             
-            self.openai_client = openai.OpenAI(api_key=api_key)
-            self.openai_model = "gpt-4o"  # keep your chosen model
-            print_success("SUCCESS: OpenAI AI-POWERED analysis enabled (GPT-4o)")
+            # Bound each request so a slow completion can't stall the whole
+            # analysis phase; the client is shared across worker threads
+            self.openai_client = openai.OpenAI(api_key=api_key, timeout=20.0, max_retries=2)
+            self.openai_model = OPENAI_MODEL
+            print_success(f"SUCCESS: OpenAI AI-POWERED analysis enabled ({OPENAI_MODEL})")
         except Exception as e:
             print_warning(f"WARNING: OpenAI setup failed: {e}")
             self.use_ai = False
 
+    def _ensure_openai_client(self):
+        """Create the OpenAI client on first use"""
+        if self.use_ai and self.openai_client is None:
+            self._setup_openai()
+        return self.openai_client
+
+    def _load_ai_cache(self) -> Dict[str, str]:
+        """Load the persisted AI response cache from file"""
+        try:
+            if os.path.exists(self._ai_cache_file):
+                with open(self._ai_cache_file, 'rb') as f:
+                    cache = json.loads(f.read())
+                if isinstance(cache, dict):
+                    return cache
+        except Exception as e:
+            print_warning(f"WARNING: Could not load AI response cache: {e}")
+        return {}
+
+    def _flush_ai_cache(self):
+        """Write new AI responses to disk (atomic tmp-file + rename)"""
+        if not self._ai_cache_dirty:
+            return
+        try:
+            tmp_file = self._ai_cache_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(self._ai_response_cache, f, separators=(',', ':'))
+            os.replace(tmp_file, self._ai_cache_file)
+            self._ai_cache_dirty = False
+        except Exception as e:
+            print_warning(f"WARNING: Could not save AI response cache: {e}")
+
+    def _ai_chat(self, system: str, prompt: str, max_tokens: int = 2000,
+                 temperature: float = 0.1, json_mode: bool = False) -> Optional[str]:
+        """Issue a chat completion through a disk-backed response cache.
+
+        At temperature 0.1 identical requests come back effectively
+        identical, and the same pattern/selector questions recur across
+        pages of one vendor - a hit skips the full network round trip (and
+        its cost). Keyed by a hash of model + messages + sampling params.
+
+        json_mode turns on the API's json_object response format, which
+        stops the model emitting markdown fences and prose around JSON-
+        object answers (only valid when the reply is a JSON object, not an
+        array).
+        """
+        key = hashlib.blake2b(
+            f"{self.openai_model}|{system}|{prompt}|{max_tokens}|{temperature}|{json_mode}".encode('utf-8', 'ignore'),
+            digest_size=16
+        ).hexdigest()
+        cached = self._ai_response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        kwargs = {}
+        if json_mode:
+            kwargs['response_format'] = {"type": "json_object"}
+        response = self.openai_client.chat.completions.create(
+            model=self.openai_model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+        content = response.choices[0].message.content
+        if content:
+            if len(self._ai_response_cache) >= 512:
+                self._ai_response_cache.pop(next(iter(self._ai_response_cache)))
+            self._ai_response_cache[key] = content
+            self._ai_cache_dirty = True
+        return content
+
     def _extract_site_name(self, domain: str) -> str:
         """Extract clean site name from domain (remove www, .com, etc.)"""
-        # Remove www. prefix
-        if domain.startswith('www.'):
-            domain = domain[4:]
-        
-        # Remove common TLDs and get main name
-        domain_parts = domain.split('.')
-        if len(domain_parts) >= 2:
-            # Take the main domain name (before the TLD)
-            site_name = domain_parts[0]
-        else:
-            site_name = domain
-        
-        # Replace any remaining special characters with underscores
-        site_name = site_name.replace('-', '_').replace('.', '_')
-        
-        return site_name
+        return _site_name_from_domain(domain)
     
-    def _optimize_html_for_ai(self, html: str, analysis_type: str = "product_links") -> str:
-        """BeautifulSoup preprocessing + AI analysis optimization"""
+    def _optimize_html_for_ai(self, html: str, analysis_type: str = "product_links",
+                              soup: Optional[BeautifulSoup] = None) -> str:
+        """BeautifulSoup preprocessing + AI analysis optimization.
+
+        A pre-parsed soup may be passed to avoid re-parsing; note that this
+        method mutates it (noise removal, attribute stripping), so callers
+        sharing a soup must call this last.
+        """
         try:
-            from bs4 import BeautifulSoup, Comment
-            soup = BeautifulSoup(html, 'html.parser')
-            
+            if soup is None:
+                soup = BeautifulSoup(html, _HTML_PARSER)
+
             # Phase 1: Remove noise elements
             for tag in soup(['script', 'style', 'noscript', 'iframe', 'embed', 'object', 'head']):
                 tag.decompose()
-            
+
             # Remove comments
-            for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+            for comment in soup.find_all(string=_is_comment):
                 comment.extract()
             
             # Phase 2: Clean up attributes for AI focus
@@ -335,21 +1650,25 @@ class UniversalWebsiteAnalyzer:
             if analysis_type == "product_links":
                 # BeautifulSoup-powered link analysis
                 link_containers = []
+
+                # Domain context is constant for the whole page - compute it
+                # once instead of re-parsing the catalog URL per container
+                catalog_url = getattr(self, 'current_catalog_url', '') or self.base_url
+                domain = _parse_url(catalog_url).netloc if catalog_url else ''
+                is_plumbersstock = 'plumbersstock.com' in domain
+
                 for container in soup.find_all(['div', 'section', 'ul', 'ol', 'main', 'article']):
                     links = container.find_all('a', href=True)
                     if len(links) >= 2:  # Container with multiple links
                         # Score container by link relevance with domain-specific patterns
                         score = 0
-                        # Get domain context for better scoring
-                        catalog_url = getattr(self, 'current_catalog_url', '') or self.base_url
-                        domain = urlparse(catalog_url).netloc if catalog_url else ''
-                        
                         for link in links:
+                            # Lowercase each link's href/text exactly once
                             href = link.get('href', '').lower()
                             text = link.get_text(strip=True).lower()
-                            
+
                             # Domain-specific scoring
-                            if 'plumbersstock.com' in domain and href.endswith('.html') and '-' in href:
+                            if is_plumbersstock and href.endswith('.html') and '-' in href:
                                 score += 3  # High score for plumbersstock pattern
                             elif any(term in href for term in ['product', 'item', '/p/', '/prod']):
                                 score += 2
@@ -362,67 +1681,82 @@ class UniversalWebsiteAnalyzer:
                         if score >= 3:
                             link_containers.append((container, score))
                 
-                # Sort by score and keep best containers
+                # Sort by score, dedup at collection time (a container can be
+                # matched more than once) and keep the best three
                 link_containers.sort(key=lambda x: x[1], reverse=True)
-                relevant_content = [container for container, score in link_containers[:3]]
+                relevant_content = {}
+                for container, score in link_containers:
+                    if len(relevant_content) >= 3:
+                        break
+                    relevant_content.setdefault(id(container), container)
                 
             else:  # product_fields
-                # BeautifulSoup-powered field analysis
-                field_elements = []
-                
-                # Find price-related elements (including nested structures)
-                price_elements = soup.find_all(['div', 'span', 'p'], 
-                                             class_=lambda x: x and any(term in str(x).lower() for term in ['price', 'cost', 'dollar']))
-                field_elements.extend(price_elements[:3])
-                
-                # Find title elements
-                title_elements = soup.find_all(['h1', 'h2', 'div', 'span'], 
-                                             class_=lambda x: x and any(term in str(x).lower() for term in ['title', 'name', 'product']))
-                field_elements.extend(title_elements[:3])
-                
-                # Find brand/manufacturer elements
-                brand_elements = soup.find_all(['a', 'span', 'div'], 
-                                             attrs={'data-testid': lambda x: x and isinstance(x, str) and ('brand' in x.lower() or 'manufacturer' in x.lower())}) or \
-                                soup.find_all(['a', 'span', 'div'], 
-                                             class_=lambda x: x and isinstance(x, (str, list)) and any(term in str(x).lower() for term in ['brand', 'manufacturer']))
-                field_elements.extend(brand_elements[:2])
-                
-                # Find SKU/model elements
-                sku_elements = soup.find_all(['span', 'div', 'p'], 
-                                           string=lambda text: text and isinstance(text, str) and any(term in text.lower() for term in ['sku:', 'model:', 'mpn:', 'part #']))
-                field_elements.extend(sku_elements[:2])
-                
-                relevant_content = field_elements
+                # BeautifulSoup-powered field analysis: one walk over the tree
+                # classifies every element exactly once (the old shape ran a
+                # full recursive find_all per field type)
+                price_elements = []
+                title_elements = []
+                brand_elements = []
+                sku_elements = []
+
+                for el in soup.descendants:
+                    name = getattr(el, 'name', None)
+                    if name is None:
+                        continue
+
+                    classes = el.get('class')
+                    cls_lower = ' '.join(classes).lower() if classes else ''
+
+                    if name in ('div', 'span', 'p') and len(price_elements) < 3 and \
+                            _PRICE_CLASS_RE.search(cls_lower):
+                        price_elements.append(el)
+                        continue
+
+                    if name in ('h1', 'h2', 'div', 'span') and len(title_elements) < 3 and \
+                            _TITLE_CLASS_RE.search(cls_lower):
+                        title_elements.append(el)
+                        continue
+
+                    if name in ('a', 'span', 'div') and len(brand_elements) < 2:
+                        testid = el.get('data-testid')
+                        if (isinstance(testid, str) and
+                                _BRAND_CLASS_RE.search(testid.lower())) or \
+                                _BRAND_CLASS_RE.search(cls_lower):
+                            brand_elements.append(el)
+                            continue
+
+                    if name in ('span', 'div', 'p') and len(sku_elements) < 2:
+                        text = el.string
+                        if text and any(term in text.lower() for term in _SKU_TEXT_TERMS):
+                            sku_elements.append(el)
+
+                # The single walk visits each node once, so the four lists are
+                # already disjoint - the dict just gives Phase 4 one shape
+                relevant_content = {
+                    id(el): el
+                    for el in price_elements + title_elements + brand_elements + sku_elements
+                }
             
             # Phase 4: Create structured output for AI
             if relevant_content:
-                new_soup = BeautifulSoup('<html><body></body></html>', 'html.parser')
-                body = new_soup.body
-                
-                # Add analysis context comment
-                context_comment = soup.new_string(f"<!-- BeautifulSoup Analysis Context: {analysis_type} -->", Comment)
-                body.append(context_comment)
-                
-                # Add unique relevant elements
-                added_elements = set()
-                for element in relevant_content[:15]:  # Limit for AI processing
-                    if element and element.parent:  # Still in DOM
-                        element_id = id(element)
-                        if element_id not in added_elements:
-                            try:
-                                # For nested price structures, preserve parent-child relationships
-                                if analysis_type == "product_fields" and element.name in ['div', 'span'] and 'price' in str(element.get('class', [])).lower():
-                                    # Include children to preserve nested structure
-                                    cloned_element = element.__copy__()
-                                    body.append(cloned_element)
-                                else:
-                                    body.append(element.__copy__())
-                                added_elements.add(element_id)
-                            except Exception as e:
-                                print(f"Error adding element: {e}")
-                                continue
-                
-                optimized_html = str(new_soup)
+                # Serialize each element straight to a string and join once -
+                # cloning nodes into a fresh tree re-copied every subtree and
+                # re-serialized the whole document at the end
+                parts = [f"<!-- BeautifulSoup Analysis Context: {analysis_type} -->"]
+
+                # Already unique (deduped at collection), so no membership
+                # checks here; nothing mutates the tree between Phase 3 and
+                # serialization, so the old "still in DOM" test is gone too
+                for element in list(relevant_content.values())[:15]:  # Limit for AI processing
+                    try:
+                        # str(element) keeps nested structure (e.g.
+                        # prices with child divs) intact
+                        parts.append(str(element))
+                    except Exception as e:
+                        print(f"Error adding element: {e}")
+                        continue
+
+                optimized_html = "<html><body>\n" + "\n".join(parts) + "\n</body></html>"
             else:
                 # Fallback: use cleaned original
                 optimized_html = str(soup)
@@ -430,11 +1764,15 @@ class UniversalWebsiteAnalyzer:
             # Phase 5: Smart truncation with structure preservation
             max_chars = 20000  # Increased for GPT-4o
             if len(optimized_html) > max_chars:
-                truncated = optimized_html[:max_chars]
-                # Try to end at a complete tag
-                last_tag_end = truncated.rfind('>')
-                if last_tag_end > max_chars * 0.7:
-                    truncated = truncated[:last_tag_end + 1]
+                # Try to end at a complete tag; anything before the 0.7
+                # acceptance threshold is rejected anyway, so only scan the
+                # tail instead of copying and walking the full prefix
+                tail_start = int(max_chars * 0.7)
+                last_tag_end = optimized_html.rfind('>', tail_start, max_chars)
+                if last_tag_end != -1:
+                    truncated = optimized_html[:last_tag_end + 1]
+                else:
+                    truncated = optimized_html[:max_chars]
                 optimized_html = truncated + "\n<!-- HTML truncated for AI analysis -->"
             
             print(f"BeautifulSoup preprocessed: {len(html)} → {len(optimized_html)} chars ({analysis_type})")
@@ -444,70 +1782,86 @@ class UniversalWebsiteAnalyzer:
             print(f"BeautifulSoup preprocessing failed: {e}, using simple truncation")
             return html[:15000]
     
-    def _extract_script_content_for_ai(self, html: str) -> str:
+    def _scan_scripts(self, soup: BeautifulSoup) -> Tuple[List[str], List[Any], List[Dict]]:
+        """Walk every <script> once, collecting everything the AI pipeline needs.
+
+        Returns (relevant_text_blocks, json_ld_payloads, other_json_payloads).
+        Each script body is touched and lowercased exactly once; results are
+        cached per soup so the individual extraction methods don't re-walk.
+        """
+        # Keyed on the soup object itself (compared by identity): holding
+        # the reference keeps the id from being recycled by a later page's
+        # soup, which would silently serve the previous page's scan
+        cached = getattr(self, '_script_scan_cache', None)
+        if cached is not None and cached[0] is soup:
+            return cached[1]
+
+        relevant_blocks = []
+        json_ld_payloads = []
+        other_json_payloads = []
+
+        for script in soup.find_all('script'):
+            content = script.string
+            if not content or not isinstance(content, str):
+                continue
+
+            # JSON-LD payloads are structured - parse them directly
+            if script.get('type') == 'application/ld+json':
+                try:
+                    json_ld_payloads.append(json.loads(content))
+                except Exception:
+                    pass
+                continue
+
+            content_lower = content.lower()
+
+            # Scripts that likely contain product data, truncated for the AI
+            if any(keyword in content_lower for keyword in ['product', 'brand', 'price', 'sku', 'mpn', 'upc', 'name']):
+                block = content.strip()
+                if len(block) > 2000:
+                    block = block[:2000] + "..."
+                relevant_blocks.append(block)
+
+            # Embedded JSON objects in product/price/sku-related scripts
+            if 'product' in content_lower or 'price' in content_lower or 'sku' in content_lower:
+                other_json_payloads.extend(_decode_json_objects(content, limit=3))
+
+        result = (relevant_blocks, json_ld_payloads, other_json_payloads)
+        self._script_scan_cache = (soup, result)
+        return result
+
+    def _extract_script_content_for_ai(self, html: str,
+                                       soup: Optional[BeautifulSoup] = None) -> str:
         """Extract relevant script content for AI analysis"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            script_tags = soup.find_all('script')
-            
-            relevant_scripts = []
-            for script in script_tags:
-                if script.string:
-                    content = script.string.strip()
-                    # Look for scripts that likely contain product data
-                    if content and isinstance(content, str) and any(keyword in content.lower() for keyword in ['product', 'brand', 'price', 'sku', 'mpn', 'upc', 'name']):
-                        # Limit script size for AI processing
-                        if len(content) > 2000:
-                            content = content[:2000] + "..."
-                        relevant_scripts.append(content)
-            
+            if soup is None:
+                soup = BeautifulSoup(html, _HTML_PARSER)
+            relevant_scripts, _, _ = self._scan_scripts(soup)
             return "\n\n".join(relevant_scripts[:5])  # Limit to 5 most relevant scripts
         except Exception as e:
             print(f"Script content extraction failed: {e}")
             return ""
     
-    def _extract_json_ld_for_ai(self, html: str) -> Dict[str, Any]:
+    def _extract_json_ld_for_ai(self, html: str,
+                                soup: Optional[BeautifulSoup] = None) -> Dict[str, Any]:
         """Extract JSON-LD and other structured data for AI analysis"""
         structured_data = {
             'json_ld': [],
             'other_json': [],
             'microdata': []
         }
-        
+
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Extract JSON-LD data
-            json_scripts = soup.find_all('script', type='application/ld+json')
-            for script in json_scripts:
-                try:
-                    data = json.loads(script.string)
-                    structured_data['json_ld'].append(data)
-                except:
-                    continue
-            
-            # Extract other JSON data (often in script tags or data attributes)
-            all_scripts = soup.find_all('script')
-            for script in all_scripts:
-                if script.string and isinstance(script.string, str) and ('product' in script.string.lower() or 
-                                    'price' in script.string.lower() or
-                                    'sku' in script.string.lower()):
-                    try:
-                        # Try to find JSON objects in script content
-                        script_content = script.string
-                        # Look for JSON-like patterns
-                        import re
-                        json_matches = re.findall(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', script_content)
-                        for match in json_matches[:3]:  # Limit to 3 matches
-                            try:
-                                json_data = json.loads(match)
-                                if isinstance(json_data, dict) and len(json_data) > 0:
-                                    structured_data['other_json'].append(json_data)
-                            except:
-                                continue
-                    except:
-                        continue
-            
+            if soup is None:
+                soup = BeautifulSoup(html, _HTML_PARSER)
+            
+            # JSON-LD and embedded JSON come from the fused single-pass
+            # script scan (shared with _extract_script_content_for_ai)
+            _, json_ld_payloads, other_json_payloads = self._scan_scripts(soup)
+            structured_data['json_ld'].extend(json_ld_payloads)
+            structured_data['other_json'].extend(other_json_payloads)
+
+
             # Extract microdata
             microdata_elements = soup.find_all(attrs={'itemtype': True})
             for elem in microdata_elements[:5]:  # Limit to 5 elements
@@ -533,40 +1887,72 @@ class UniversalWebsiteAnalyzer:
             print(f"Error extracting structured data for AI: {e}")
         return structured_data
     
+    # Static header template for _get_random_headers; only the User-Agent
+    # varies per call, so the rest isn't rebuilt key-by-key every time
+    _HEADER_TEMPLATE = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'max-age=0',
+        'DNT': '1'
+    }
+
+    # Fixed Chrome-like header block for _fetch_with_requests approach 4;
+    # requests never mutates a passed headers dict, so it is shared as-is
+    _CHROME_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Sec-Fetch-User': '?1',
+        'Cache-Control': 'max-age=0',
+        'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+        'sec-ch-ua-mobile': '?0',
+        'sec-ch-ua-platform': '"Windows"'
+    }
+
+    # The exact headers that work in validate.py, shared by the simple
+    # fetch path instead of being rebuilt per call
+    _SIMPLE_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1'
+    }
+
     def _get_random_headers(self) -> Dict[str, str]:
         """Generate random browser headers"""
-        return {
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0',
-            'DNT': '1'
-        }
+        headers = dict(self._HEADER_TEMPLATE)  # C-level copy of the template
+        headers['User-Agent'] = next(self._ua_cycle)
+        return headers
     
     def _fetch_simple_like_validate(self, url: str, timeout: int = 10) -> Optional[str]:
         """Fetch page using SIMPLE approach first, then PROXY as fallback"""
-        
-        # Use the exact headers that work in validate.py
-        simple_headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        
-        # Try SIMPLE approach first (no proxy)
+
+        # Try SIMPLE approach first (no proxy), preferring the persistent
+        # HTTP/2 client: keep-alive skips the TCP/TLS handshake on repeat
+        # hosts and h2 multiplexes redirect chains over one connection
         try:
             print(f"Trying SIMPLE approach (no proxy) for {url}")
-            response = requests.get(url, headers=simple_headers, timeout=timeout)
-            
+            if self._http2_client is not None:
+                response = self._http2_client.get(
+                    url, headers=self._SIMPLE_HEADERS, timeout=timeout)
+            else:
+                response = self.session.get(
+                    url, headers=self._SIMPLE_HEADERS, timeout=timeout, stream=True)
+
             if response.status_code == 200:
                 print(f"SIMPLE approach succeeded! ({len(response.text)} characters)")
                 return response.text
@@ -577,16 +1963,8 @@ class UniversalWebsiteAnalyzer:
         # Fallback to PROXY approach (Webshare) if simple fails
         if self.proxies and any('server' in proxy and 'username' in proxy for proxy in self.proxies):
             try:
-                # Use first Webshare proxy
-                webshare_proxy = next(proxy for proxy in self.proxies if 'server' in proxy and 'username' in proxy)
-                proxy_url = f"http://{webshare_proxy['username']}:{webshare_proxy['password']}@{webshare_proxy['server'].replace('http://', '')}"
-                proxy_dict = {
-                    'http': proxy_url,
-                    'https': proxy_url
-                }
-                
                 print(f"Trying PROXY approach (Webshare) for {url}")
-                response = requests.get(url, headers=simple_headers, proxies=proxy_dict, timeout=timeout)
+                response = self.proxy_session.get(url, headers=self._SIMPLE_HEADERS, timeout=timeout, stream=True)
                 
                 if response.status_code == 200:
                     print(f"PROXY approach succeeded! ({len(response.text)} characters)")
@@ -618,68 +1996,101 @@ class UniversalWebsiteAnalyzer:
             'sec-ch-ua-platform': '"Windows"',
             'DNT': '1'
         }
-        
-        session = requests.Session()
-        
+
+        # Prefer the Chrome-impersonating session (real TLS fingerprint),
+        # then the HTTP/2 client (one multiplexed keep-alive connection,
+        # Brotli bodies), then the pooled requests session. Cookies acquired
+        # here also benefit later fetches against the same host.
+        client = self._impersonate_session or self._http2_client
+        if client is not None:
+            def _get(u, headers):
+                return client.get(u, headers=headers, timeout=timeout)
+            cookie_jar = client.cookies
+        else:
+            session = self.session
+
+            def _get(u, headers):
+                return session.get(u, headers=headers, timeout=timeout, allow_redirects=True)
+            cookie_jar = self.session.cookies
+
         # Method 1: Replicate the EXACT successful flow from your request
         try:
             from urllib.parse import urlparse
-            parsed = urlparse(url)
+            parsed = _parse_url(url)
             base_url = f"{parsed.scheme}://{parsed.netloc}"
-            
-            print(f"Trying CF-RAY bypass (cookie acquisition method) for {url}")
-            # Step 1: Visit homepage to get initial session
-            print("  → Step 1: Visiting homepage to establish session...")
-            homepage_headers = cf_bypass_headers.copy()
-            homepage_headers['Sec-Fetch-Site'] = 'none'  # Direct navigation
-            
-            response = session.get(base_url, headers=homepage_headers, timeout=timeout, allow_redirects=True)
-            print(f"  → Homepage: status {response.status_code}, cookies: {len(session.cookies)}")
-            time.sleep(random.uniform(2, 4))
-            
-            # Step 2: Visit catalog page (like your referer)
-            catalog_candidates = [
-                f"{base_url}/pellet-guns/pellet-pistols",
-                f"{base_url}/bb-guns/bb-pistols", 
-                f"{base_url}/discounts-specials"
-            ]
-            
-            catalog_url = None
-            for candidate in catalog_candidates:
-                print(f"  → Step 2: Trying catalog page: {candidate}")
+
+            _log.debug("Trying CF-RAY bypass (cookie acquisition method) for %s", url)
+            if parsed.netloc in self._cf_warm_hosts:
+                # Cookies from a previous successful bypass are still in the
+                # jar - skip the warmup round trips and go straight in
+                _log.debug("Host already warm, skipping homepage/catalog warmup")
+                catalog_url = base_url
+            else:
+                # Step 1: Visit homepage to get initial session
+                _log.debug("Step 1: Visiting homepage to establish session")
+                homepage_headers = cf_bypass_headers.copy()
+                homepage_headers['Sec-Fetch-Site'] = 'none'  # Direct navigation
+
+                response = _get(base_url, homepage_headers)
+                _log.debug("Homepage: status %s, cookies: %s", response.status_code, len(cookie_jar))
+                time.sleep(self._rng.uniform(2, 4))
+
+                # Step 2: Visit catalog page (like your referer)
+                catalog_candidates = [
+                    f"{base_url}/pellet-guns/pellet-pistols",
+                    f"{base_url}/bb-guns/bb-pistols",
+                    f"{base_url}/discounts-specials"
+                ]
+
+                # Probe all catalog candidates concurrently; first 200 wins.
+                # Serial probing paid a full request + politeness sleep per miss.
                 catalog_headers = cf_bypass_headers.copy()
                 catalog_headers['Referer'] = base_url
-                
-                cat_response = session.get(candidate, headers=catalog_headers, timeout=timeout, allow_redirects=True)
-                print(f"  → Catalog attempt: {candidate}, status {cat_response.status_code}")
-                if cat_response.status_code == 200:
-                    catalog_url = candidate
-                    print(f"  → Catalog success: {catalog_url}, cookies: {len(session.cookies)}")
-                    break
-                time.sleep(random.uniform(1, 2))
-            
-            if not catalog_url:
-                catalog_url = base_url  # Fallback
-            
-            time.sleep(random.uniform(2, 4))
-            
+
+                _log.debug("Step 2: Probing %s catalog pages concurrently", len(catalog_candidates))
+                catalog_url = None
+                with ThreadPoolExecutor(max_workers=len(catalog_candidates)) as pool:
+                    futures = {
+                        pool.submit(_get, candidate, catalog_headers): candidate
+                        for candidate in catalog_candidates
+                    }
+                    for future in as_completed(futures):
+                        candidate = futures[future]
+                        try:
+                            cat_response = future.result()
+                        except Exception as probe_error:
+                            _log.debug("Catalog attempt failed: %s (%s)", candidate, probe_error)
+                            continue
+                        _log.debug("Catalog attempt: %s, status %s", candidate, cat_response.status_code)
+                        if cat_response.status_code == 200 and catalog_url is None:
+                            catalog_url = candidate
+                            _log.debug("Catalog success: %s, cookies: %s", catalog_url, len(cookie_jar))
+
+                if not catalog_url:
+                    catalog_url = base_url  # Fallback
+
+                time.sleep(self._rng.uniform(2, 4))
+
             # Step 3: Access target page with proper referer (like your successful request)
-            print(f"  → Step 3: Accessing target page with referer...")
+            _log.debug("Step 3: Accessing target page with referer")
             target_headers = cf_bypass_headers.copy()
             target_headers['Referer'] = catalog_url  # This is key!
-            
-            response = session.get(url, headers=target_headers, timeout=timeout, allow_redirects=True)
-            
+
+            response = _get(url, target_headers)
+
             # Check for success (allow cf-ray in headers but not as protection page)
             if response.status_code == 200:
-                content = response.text
-                if len(content) > 50000:  # Substantial content like your 530KB
-                    print(f"CF-RAY bypass succeeded! ({len(content)} characters, cookies: {len(session.cookies)})")
+                # Gate on the raw byte length first - response.text pays a
+                # charset-detection decode we only want on success
+                if len(response.content) > 50000:  # Substantial content like your 530KB
+                    content = response.text
+                    print(f"CF-RAY bypass succeeded! ({len(content)} characters, cookies: {len(cookie_jar)})")
+                    self._cf_warm_hosts.add(parsed.netloc)
                     return content
                 else:
-                    print(f"CF-RAY method: Got response but content too small ({len(content)} chars)")
+                    _log.debug("CF-RAY method: Got response but content too small (%s bytes)", len(response.content))
             else:
-                print(f"CF-RAY method: status {response.status_code}")
+                _log.debug("CF-RAY method: status %s", response.status_code)
         except Exception as e:
             print(f"CF-RAY cookie method failed: {e}")
         # Method 3: With rotating User-Agents
@@ -692,171 +2103,161 @@ class UniversalWebsiteAnalyzer:
         
         for i, ua in enumerate(modern_user_agents[:2], 3):  # Try max 2 more attempts
             try:
-                print(f"Trying CF-RAY bypass (method {i} - UA rotation) for {url}")
+                _log.debug("Trying CF-RAY bypass (method %s - UA rotation) for %s", i, url)
                 rotation_headers = cf_bypass_headers.copy()
                 rotation_headers['User-Agent'] = ua
-                
-                response = session.get(url, headers=rotation_headers, timeout=timeout, allow_redirects=True)
-                
-                if response.status_code == 200 and 'cf-ray' not in response.text.lower():
-                    print(f"CF-RAY bypass method {i} succeeded! ({len(response.text)} characters)")
-                    return response.text
+
+                response = _get(url, rotation_headers)
+
+                if response.status_code == 200 and not _CFRAY_BYTES_RE.search(response.content):
+                    content = response.text  # Decode once, only on success
+                    print(f"CF-RAY bypass method {i} succeeded! ({len(content)} characters)")
+                    return content
                 else:
-                    print(f"CF-RAY method {i}: status {response.status_code}")
+                    _log.debug("CF-RAY method %s: status %s", i, response.status_code)
             except Exception as e:
-                print(f"CF-RAY method {i} failed: {e}")
-            time.sleep(random.uniform(1, 2))
+                _log.debug("CF-RAY method %s failed: %s", i, e)
+            time.sleep(self._rng.uniform(1, 2))
         
         return None
     
+    # Shared Playwright instance: Chromium cold start costs seconds and GBs
+    # of peak RSS per launch, so one lazily-started browser is reused across
+    # fetches while each call gets its own cheap context
+    _pw = None
+    _pw_browsers = {}
+    _pw_lock = threading.Lock()
+
+    @classmethod
+    def _get_browser(cls):
+        """Launch the shared stealth browser on first use.
+
+        New headless mode passes the same fingerprint checks as a headful
+        window without the X server, and dropping slow_mo removes 100-200ms
+        of injected latency per Playwright call.
+        """
+        return cls._launch_shared('cf-stealth', True, [*_STEALTH_ARGS, '--headless=new'])
+
+    @classmethod
+    def _get_fetch_browser(cls, headless: bool, fast_mode: bool):
+        """Shared browser for the fetch ladder, one per launch flavor"""
+        if fast_mode:
+            return cls._launch_shared(f'fast-{headless}', headless, list(_FAST_BROWSER_ARGS))
+        return cls._launch_shared(f'stealth-{headless}', headless, list(_STEALTH_BROWSER_ARGS))
+
+    @classmethod
+    def _launch_shared(cls, mode: str, headless: bool, args: list):
+        """Launch (once per mode) and cache a browser; contexts stay per call.
+
+        With CHROME_CDP_ENDPOINT set (see run_browser_server.py) every mode
+        attaches to that one externally-run Chromium instead of launching
+        its own - launch flags and headless mode are then the server's
+        business, but contexts remain isolated per fetch.
+        """
+        with cls._pw_lock:
+            browser = cls._pw_browsers.get(mode)
+            if browser is None or not browser.is_connected():
+                from playwright.sync_api import sync_playwright
+                if cls._pw is None:
+                    cls._pw = sync_playwright().start()
+                    atexit.register(cls._close_browser)
+                if _CDP_ENDPOINT:
+                    if _CDP_ENDPOINT.startswith(('ws://', 'wss://')):
+                        browser = cls._pw.chromium.connect(_CDP_ENDPOINT)
+                    else:
+                        browser = cls._pw.chromium.connect_over_cdp(_CDP_ENDPOINT)
+                else:
+                    browser = cls._pw.chromium.launch(headless=headless, args=args)
+                cls._pw_browsers[mode] = browser
+        return browser
+
+    @classmethod
+    def _close_browser(cls):
+        """Shut down the shared browsers (registered with atexit)"""
+        with cls._pw_lock:
+            for browser in cls._pw_browsers.values():
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+            cls._pw_browsers.clear()
+            if cls._pw is not None:
+                try:
+                    cls._pw.stop()
+                except Exception:
+                    pass
+                cls._pw = None
+
     def _fetch_playwright_cf_ray_bypass(self, url: str) -> Optional[str]:
         """Advanced Playwright-based cf-ray bypass using proven techniques"""
-        
+
         if not PLAYWRIGHT_AVAILABLE:
             return None
-            
+
         try:
-            from playwright.sync_api import sync_playwright
             from urllib.parse import urlparse
-            
+
             print(f"Trying advanced Playwright CF-RAY bypass for {url}")
-            with sync_playwright() as p:
-                # Advanced browser arguments for stealth
-                stealth_args = [
-                    '--no-sandbox',
-                    '--disable-blink-features=AutomationControlled',
-                    '--exclude-switches=enable-automation',
-                    '--disable-web-security',
-                    '--disable-extensions',
-                    '--disable-plugins',
-                    '--disable-background-timer-throttling',
-                    '--disable-renderer-backgrounding',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-default-apps',
-                    '--disable-sync',
-                    '--disable-translate',
-                    '--hide-scrollbars',
-                    '--mute-audio',
-                    '--no-default-browser-check',
-                    '--disable-ipc-flooding-protection',
-                    '--password-store=basic',
-                    '--use-mock-keychain',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu'
-                ]
-                
-                browser = p.chromium.launch(
-                    headless=False,  # Visible for debugging
-                    args=stealth_args,
-                    slow_mo=random.randint(100, 200)
-                )
-                
+            browser = self._get_browser()
+            context = None
+            try:
                 # Create context with realistic properties
                 context = browser.new_context(
                     user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
                     viewport={"width": 1920, "height": 1080},
                     locale="en-US",
                     timezone_id="America/New_York",
-                    extra_http_headers={
-                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                        "Accept-Language": "en-US,en;q=0.9",
-                        "Accept-Encoding": "gzip, deflate, br",
-                        "sec-ch-ua": '"Not_A Brand";v="8", "Chromium";v="121", "Google Chrome";v="121"',
-                        "sec-ch-ua-mobile": "?0",
-                        "sec-ch-ua-platform": '"Windows"'
-                    }
+                    extra_http_headers=_STEALTH_HEADERS
                 )
-                
-                # Advanced stealth script based on cloudflare_bypass.py
-                stealth_script = """
-                // Hide webdriver property thoroughly
-                Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
-                delete Object.getPrototypeOf(navigator).webdriver;
-                
-                // Advanced Chrome runtime spoofing
-                window.chrome = {
-                    app: { isInstalled: false },
-                    runtime: {
-                        onConnect: undefined,
-                        onMessage: undefined,
-                        connect: () => ({
-                            onMessage: { addListener: () => {}, removeListener: () => {} },
-                            postMessage: () => {},
-                            disconnect: () => {}
-                        })
-                    }
-                };
-                
-                // Randomize fingerprints
-                Object.defineProperty(navigator, 'hardwareConcurrency', {
-                    get: () => Math.floor(Math.random() * 4) + 4
-                });
-                
-                Object.defineProperty(navigator, 'deviceMemory', {
-                    get: () => [4, 8, 16][Math.floor(Math.random() * 3)]
-                });
-                
-                // Canvas fingerprint spoofing
-                const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-                HTMLCanvasElement.prototype.toDataURL = function(type) {
-                    const shift = Math.floor(Math.random() * 10) - 5;
-                    const canvas = this;
-                    const ctx = canvas.getContext('2d');
-                    if (ctx) {
-                        const imageData = ctx.getImageData(0, 0, canvas.width, canvas.height);
-                        for (let i = 0; i < imageData.data.length; i += 4) {
-                            imageData.data[i] = Math.min(255, Math.max(0, imageData.data[i] + shift));
-                        }
-                        ctx.putImageData(imageData, 0, 0);
-                    }
-                    return originalToDataURL.apply(this, arguments);
-                };
-                """
-                
-                context.add_init_script(stealth_script)
+
+                context.add_init_script(path=_init_script_path(_STEALTH_SCRIPT))
                 page = context.new_page()
                 
                 # Session building approach
-                parsed = urlparse(url)
+                parsed = _parse_url(url)
                 base_url = f"{parsed.scheme}://{parsed.netloc}"
                 
                 # Step 1: Visit homepage first
-                print("  → Building session via homepage...")
+                _log.debug("Building session via homepage")
                 try:
                     response = page.goto(base_url, wait_until="domcontentloaded", timeout=30000)
-                    if "cf-ray" in page.content().lower() or "checking your browser" in page.content().lower():
-                        print("  → Cloudflare challenge detected, waiting...")
+                    if _CF_CHALLENGE_RE.search(page.content()):
+                        _log.debug("Cloudflare challenge detected, waiting")
                         page.wait_for_function(
                             "!document.body.innerText.includes('Checking your browser')",
                             timeout=30000
                         )
-                        print("  → Challenge resolved!")
-                    time.sleep(random.uniform(3, 6))
+                        _log.debug("Challenge resolved")
+                    time.sleep(self._rng.uniform(3, 6))
                     
                     # Simulate human behavior
                     page.evaluate("window.scrollTo(0, document.body.scrollHeight / 3)")
-                    time.sleep(random.uniform(1, 2))
+                    time.sleep(self._rng.uniform(1, 2))
                     page.evaluate("window.scrollTo(0, 0)")
-                    time.sleep(random.uniform(1, 2))
+                    time.sleep(self._rng.uniform(1, 2))
                     
                 except Exception as e:
-                    print(f"  → Homepage visit failed: {e}")
+                    _log.debug("Homepage visit failed: %s", e)
                 # Step 2: Try target URL
-                print("  → Accessing target page...")
+                _log.debug("Accessing target page")
                 try:
                     response = page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                    
-                    # Check for challenge again
-                    if "cf-ray" in page.content().lower() or "checking your browser" in page.content().lower():
-                        print("  → Target page challenge detected, waiting...")
+
+                    # Let the page settle, then snapshot once - page.content()
+                    # is a full CDP DOM.getOuterHTML round trip, so the
+                    # challenge check, size print and return all share one
+                    # fetch (two when a challenge actually resolved)
+                    time.sleep(self._rng.uniform(2, 4))
+                    content = page.content()
+                    if _CF_CHALLENGE_RE.search(content):
+                        _log.debug("Target page challenge detected, waiting")
                         page.wait_for_function(
                             "!document.body.innerText.includes('Checking your browser')",
                             timeout=30000
                         )
-                        print("  → Target challenge resolved!")
-                    time.sleep(random.uniform(2, 4))
-                    content = page.content()
-                    
+                        _log.debug("Target challenge resolved")
+                        content = page.content()
+
                     if response.status == 200 and content:
                         print(f"Advanced Playwright CF-RAY bypass succeeded! ({len(content)} characters)")
                         return content
@@ -864,105 +2265,179 @@ class UniversalWebsiteAnalyzer:
                         print(f"Advanced Playwright bypass: status {response.status}")
                 except Exception as e:
                     print(f"Target page access failed: {e}")
-                finally:
-                    browser.close()
-                    
+            finally:
+                # Close only the per-call context; the browser stays warm for
+                # the next URL
+                if context is not None:
+                    context.close()
+
         except Exception as e:
             print(f"Advanced Playwright CF-RAY bypass failed: {e}")
         return None
     
+    def _fetch_playwright_cf_ray_bypass_many(self, urls: List[str],
+                                             concurrency: int = 3) -> Dict[str, Optional[str]]:
+        """Fetch several URLs through the CF-RAY bypass concurrently.
+
+        The serial bypass spends 10-30s per URL waiting on network and
+        challenge timers, so batches go through the async Playwright API with
+        a semaphore bound instead. One browser serves the whole batch (the
+        async API can't share the sync pooled browser), with a context per
+        URL. Returns {url: html or None}.
+        """
+        if not PLAYWRIGHT_AVAILABLE or not urls:
+            return {url: None for url in urls}
+
+        async def _run() -> Dict[str, Optional[str]]:
+            from playwright.async_api import async_playwright
+
+            sem = asyncio.Semaphore(concurrency)
+            results: Dict[str, Optional[str]] = {}
+
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(
+                    headless=True,
+                    args=[*_STEALTH_ARGS, '--headless=new']
+                )
+
+                async def _fetch(url: str) -> None:
+                    async with sem:
+                        context = None
+                        try:
+                            context = await browser.new_context(
+                                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+                                viewport={"width": 1920, "height": 1080},
+                                locale="en-US",
+                                timezone_id="America/New_York",
+                                extra_http_headers=_STEALTH_HEADERS
+                            )
+                            await context.add_init_script(path=_init_script_path(_STEALTH_SCRIPT))
+                            page = await context.new_page()
+
+                            parsed = _parse_url(url)
+                            base_url = f"{parsed.scheme}://{parsed.netloc}"
+
+                            # Same homepage -> target two-step as the sync
+                            # path, with awaits instead of blocking sleeps
+                            try:
+                                await page.goto(base_url, wait_until="domcontentloaded", timeout=30000)
+                                if _CF_CHALLENGE_RE.search(await page.content()):
+                                    await page.wait_for_function(
+                                        "!document.body.innerText.includes('Checking your browser')",
+                                        timeout=30000
+                                    )
+                                await asyncio.sleep(self._rng.uniform(3, 6))
+                            except Exception as e:
+                                _log.debug("Homepage visit failed: %s", e)
+
+                            response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                            # One snapshot after settling, a second only when
+                            # a challenge actually resolved
+                            await asyncio.sleep(self._rng.uniform(2, 4))
+                            content = await page.content()
+                            if _CF_CHALLENGE_RE.search(content):
+                                await page.wait_for_function(
+                                    "!document.body.innerText.includes('Checking your browser')",
+                                    timeout=30000
+                                )
+                                content = await page.content()
+
+                            if response.status == 200 and content:
+                                results[url] = content
+                            else:
+                                results[url] = None
+                        except Exception as e:
+                            print(f"Async CF-RAY bypass failed for {url}: {e}")
+                            results[url] = None
+                        finally:
+                            if context is not None:
+                                await context.close()
+
+                await asyncio.gather(*(_fetch(url) for url in urls))
+                await browser.close()
+
+            return results
+
+        try:
+            return asyncio.run(_run())
+        except Exception as e:
+            print(f"Async CF-RAY bypass batch failed: {e}")
+            return {url: None for url in urls}
+
     def _ai_analyze_html_for_patterns(self, html: str, analysis_type: str = "product_links") -> Dict[str, Any]:
         """Use AI to analyze HTML and identify patterns"""
-        if not self.use_ai or not self.openai_client:
+        if not self.use_ai or not self._ensure_openai_client():
             return {}
         
         try:
-            # Extract JSON-LD and structured data first  
-            json_ld_data = self._extract_json_ld_for_ai(html)
-            
-            # Extract and prepare script tags for AI analysis
-            script_data = self._extract_script_content_for_ai(html)
-            
-            # Optimize HTML for AI analysis with multiple strategies
-            html_sample = self._optimize_html_for_ai(html, analysis_type)
-            
-            if analysis_type == "product_links":
+            # Digest the page once per unique HTML: the JSON-LD/script passes
+            # and the structured-data prompt block are identical for both
+            # analysis types, so a product_links + product_fields pair shares
+            # one preprocessing run. Keyed by content hash, capped small.
+            key = hashlib.blake2b(html.encode('utf-8', 'ignore'), digest_size=16).hexdigest()
+            digest = self._html_digest_cache.get(key)
+            if digest is None:
+                # Parse the page once and share the soup across the
+                # preprocessing passes (_optimize_html_for_ai mutates it, so
+                # it must stay last and isn't reusable afterwards)
+                soup = BeautifulSoup(html, _HTML_PARSER)
+                json_ld_data = self._extract_json_ld_for_ai(html, soup=soup)
+                script_data = self._extract_script_content_for_ai(html, soup=soup)
+
                 structured_data_text = ""
                 if json_ld_data['json_ld'] or json_ld_data['other_json'] or json_ld_data['microdata']:
                     structured_data_text = f"""
-                    
+
 Structured Data Found:
 JSON-LD: {json.dumps(json_ld_data['json_ld'][:2], indent=2) if json_ld_data['json_ld'] else 'None'}
 Other JSON: {json.dumps(json_ld_data['other_json'][:2], indent=2) if json_ld_data['other_json'] else 'None'}
 Microdata: {json.dumps(json_ld_data['microdata'][:2], indent=2) if json_ld_data['microdata'] else 'None'}
 """
-                
-                # Get catalog URL context for better analysis
-                catalog_url = getattr(self, 'current_catalog_url', '') or self.base_url
-                domain = urlparse(catalog_url).netloc
-                
-                prompt = f"""
-Analyze this HTML from a catalog/category page on {domain} and identify CSS selectors for product links.
-
-CONTEXT: This HTML comes from the catalog URL: {catalog_url}
-The goal is to find links that lead to individual product detail pages from this catalog listing.
 
-SPECIFIC ANALYSIS INSTRUCTIONS:
-1. Focus on links that would lead to INDIVIDUAL PRODUCT PAGES (not categories, brands, or navigation)
-2. Look for URL patterns in href attributes that indicate product pages
-3. Analyze the actual HTML structure to find product containers and their links
-4. Consider the domain structure - if it's plumbersstock.com, look for .html patterns; if it's other domains, look for their specific patterns
-5. Prioritize links that appear multiple times in a listing format
-6. Exclude obvious non-product links (navigation, account, cart, brands, help, etc.)
+                if len(self._html_digest_cache) >= 8:
+                    self._html_digest_cache.pop(next(iter(self._html_digest_cache)))
+                digest = {
+                    'json_ld': json_ld_data,
+                    'script': script_data,
+                    'structured_text': structured_data_text,
+                    'samples': {},
+                }
+                self._html_digest_cache[key] = digest
+            else:
+                soup = None  # consumed by the first _optimize_html_for_ai run
 
-DOMAIN-SPECIFIC HINTS:
-- plumbersstock.com: Look for .html ending URLs with hyphens (e.g., /product-name-model.html)
-- Sites with /product/ or /p/ patterns: Look for those specific patterns
-- Sites with product IDs: Look for numeric or alphanumeric patterns
-- E-commerce sites: Look for links within product cards, tiles, or grid items
+            json_ld_data = digest['json_ld']
+            script_data = digest['script']
+            structured_data_text = digest['structured_text']
 
-HTML sample from {catalog_url}:
-```html
-{html_sample}
-```
-{structured_data_text}
+            # The optimized sample depends on the analysis type, so it gets
+            # its own slot in the digest
+            html_sample = digest['samples'].get(analysis_type)
+            if html_sample is None:
+                html_sample = self._optimize_html_for_ai(html, analysis_type, soup=soup)
+                digest['samples'][analysis_type] = html_sample
 
-IMPORTANT: Return ONLY valid JSON with this exact structure (no markdown, no explanations):
-{{
-    "product_link_patterns": [
-        {{
-            "selector": "a[href$='.html'][href*='-']:not([href*='/brands/']):not([href*='/account'])",
-            "explanation": "Product links ending with .html containing hyphens, excluding non-product pages",
-            "confidence": 0.9,
-            "example_count": 5
-        }}
-    ],
-    "container_selectors": [
-        {{
-            "selector": ".product-item, .product-card, .item-container",
-            "explanation": "Individual product containers in the listing",
-            "confidence": 0.8
-        }}
-    ],
-    "url_patterns_detected": [
-        "Pattern 1: /product-name-model.html",
-        "Pattern 2: /category/product-id"
-    ],
-    "structured_data_insights": "Insights from JSON-LD or microdata if available"
-}}
-"""
+            if analysis_type == "product_links":
+                # Get catalog URL context for better analysis
+                catalog_url = getattr(self, 'current_catalog_url', '') or self.base_url
+                domain = _parse_url(catalog_url).netloc
+                
+                # Join static template sections with the dynamic parts - the
+                # big instruction and JSON-schema blocks are module constants
+                prompt = ''.join((
+                    f"\nAnalyze this HTML from a catalog/category page on {domain} and identify CSS selectors for product links.\n\n",
+                    f"CONTEXT: This HTML comes from the catalog URL: {catalog_url}\n",
+                    "The goal is to find links that lead to individual product detail pages from this catalog listing.\n",
+                    _PROD_LINK_PROMPT_BODY,
+                    f"\nHTML sample from {catalog_url}:\n```html\n",
+                    html_sample,
+                    "\n```\n",
+                    structured_data_text,
+                    _PROD_LINK_PROMPT_TAIL,
+                ))
             
             elif analysis_type == "product_fields":
-                structured_data_text = ""
-                if json_ld_data['json_ld'] or json_ld_data['other_json'] or json_ld_data['microdata']:
-                    structured_data_text = f"""
-                    
-Structured Data Found:
-JSON-LD: {json.dumps(json_ld_data['json_ld'][:2], indent=2) if json_ld_data['json_ld'] else 'None'}
-Other JSON: {json.dumps(json_ld_data['other_json'][:2], indent=2) if json_ld_data['other_json'] else 'None'}
-Microdata: {json.dumps(json_ld_data['microdata'][:2], indent=2) if json_ld_data['microdata'] else 'None'}
-"""
-
+                # structured_data_text comes pre-serialized from the digest
                 script_data_text = ""
                 if script_data:
                     script_data_text = f"""
@@ -973,108 +2448,38 @@ Script Tags with Product Data:
 ```
 """
                 
-                prompt = f"""
-Analyze this HTML from a product page and identify patterns for extracting product information.
-
-Look for:
-1. Product title/name
-2. Price information  
-3. Brand/manufacturer/make
-4. SKU/model number/part number/MPN
-5. Product codes (UPC, GTIN, barcode, EAN)
-6. PRIORITY: Use structured data (JSON-LD, microdata) and script tags when available for accurate patterns
-
-HTML sample:
-```html
-{html_sample}
-```
-{structured_data_text}{script_data_text}
-
-IMPORTANT: Return ONLY valid JSON with this exact structure (no markdown, no explanations):
-{{
-    "field_patterns": {{
-        "title": {{
-            "selectors": ["h1.product-title", ".product-name"],
-            "regex_patterns": ["<h1[^>]*>([^<]+)</h1>"],
-            "json_paths": ["name", "title"] if found in structured data,
-            "confidence": 0.9
-        }},
-        "price": {{
-            "selectors": [".price", ".cost"],
-            "regex_patterns": ["\\$([\\d,]+\\.\\d{{2}})"],
-            "json_paths": ["offers.price", "price"] if found in structured data,
-            "confidence": 0.8
-        }},
-        "brand": {{
-            "selectors": [".brand", ".manufacturer"],
-            "regex_patterns": ["brand[\"\\s:]*([A-Za-z0-9\\s&.-]+)"],
-            "json_paths": ["brand.name", "brand", "manufacturer"] if found in structured data,
-            "confidence": 0.7
-        }},
-        "sku": {{
-            "selectors": [".sku", ".item-number"],
-            "regex_patterns": ["sku[\"\\s:]*([A-Za-z0-9-_\\s\\.]+)"],
-            "json_paths": ["sku", "productID"] if found in structured data,
-            "confidence": 0.7
-        }},
-        "model": {{
-            "selectors": [".model", ".part-number"],
-            "regex_patterns": ["model[\"\\s:]*([A-Za-z0-9-_\\s\\.]+)"],
-            "json_paths": ["mpn", "model", "partNumber"] if found in structured data,
-            "confidence": 0.7
-        }},
-        "product_code": {{
-            "selectors": [".upc", ".gtin", ".ean", ".ean13"],
-            "regex_patterns": ["upc[\"\\s:]*([A-Za-z0-9-_]+)", "ean[\"\\s:]*([0-9]{{8}}|[0-9]{{13}})"],
-            "json_paths": ["gtin", "upc", "gtin13", "ean", "ean13", "europeanArticleNumber"] if found in structured data,
-            "confidence": 0.6
-        }}
-    }},
-    "structured_data_fields": {{
-        "available": true/false,
-        "source": "json-ld|microdata|other_json",
-        "direct_extraction_possible": true/false
-    }}
-}}
-"""
-            
-            response = self.openai_client.chat.completions.create(
-                model=self.openai_model,
-                messages=[
-                    {"role": "system", "content": "You are an expert web scraper who analyzes HTML to identify patterns for data extraction. You MUST respond with valid JSON only. No markdown, no explanations, no text outside the JSON structure."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=2000
+                prompt = ''.join((
+                    _PROD_FIELD_PROMPT_HEAD,
+                    html_sample,
+                    "\n```\n",
+                    structured_data_text,
+                    script_data_text,
+                    _PROD_FIELD_PROMPT_TAIL,
+                ))
+            
+            response_content = self._ai_chat(
+                "You are an expert web scraper who analyzes HTML to identify patterns for data extraction. You MUST respond with valid JSON only. No markdown, no explanations, no text outside the JSON structure.",
+                prompt,
+                max_tokens=2000,
+                json_mode=True
             )
-            
+
             # Parse the JSON response with better error handling
-            response_content = response.choices[0].message.content.strip()
-            
-            # Log the raw response for debugging
-            print(f"AI raw response: {response_content[:200]}...")
-            # Clean and validate the response
+            response_content = (response_content or '').strip()
+
             if not response_content:
                 print(f"AI returned empty response for {analysis_type}")
                 return {}
-            
-            # Try to extract JSON if it's wrapped in markdown or other text
-            json_start = response_content.find('{')
-            json_end = response_content.rfind('}')
-            
-            if json_start != -1 and json_end != -1 and json_end > json_start:
-                json_content = response_content[json_start:json_end + 1]
-            else:
-                json_content = response_content
-            
-            try:
-                ai_analysis = json.loads(json_content)
+
+            # One raw_decode pass handles markdown-wrapped and bare JSON alike
+            ai_analysis = _extract_first_json(response_content)
+            if isinstance(ai_analysis, dict):
                 print(f"AI analysis completed for {analysis_type}")
                 return ai_analysis
-            except json.JSONDecodeError as je:
-                print(f"AI returned invalid JSON for {analysis_type}: {je}")
-                print(f"Invalid JSON content: {json_content}")
-                return {}
+
+            print(f"AI returned invalid JSON for {analysis_type}")
+            print(f"Invalid JSON content: {response_content}")
+            return {}
             
         except Exception as e:
             print(f"AI analysis failed for {analysis_type}: {e}")
@@ -1082,7 +2487,7 @@ IMPORTANT: Return ONLY valid JSON with this exact structure (no markdown, no exp
     
     def _ai_improve_regex_pattern(self, field_name: str, current_pattern: str, sample_html: str, expected_value: str = None) -> str:
         """Use AI to improve regex patterns"""
-        if not self.use_ai or not self.openai_client:
+        if not self.use_ai or not self._ensure_openai_client():
             return current_pattern
         
         try:
@@ -1111,17 +2516,11 @@ Special note for {field_name}: {"If this is for nested price elements with child
 Return only the improved regex pattern, nothing else.
 """
             
-            response = self.openai_client.chat.completions.create(
-                model=self.openai_model,
-                messages=[
-                    {"role": "system", "content": "You are a regex expert. Return only the improved regex pattern."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
+            improved_pattern = (self._ai_chat(
+                "You are a regex expert. Return only the improved regex pattern.",
+                prompt,
                 max_tokens=200
-            )
-            
-            improved_pattern = response.choices[0].message.content.strip()
+            ) or '').strip()
             
             # Remove markdown formatting if present
             if improved_pattern.startswith('```'):
@@ -1148,32 +2547,26 @@ Return only the improved regex pattern, nothing else.
     
     def _ai_generate_css_selector(self, html: str, description: str) -> str:
         """Use AI to generate CSS selectors"""
-        if not self.use_ai or not self.openai_client:
+        if not self.use_ai or not self._ensure_openai_client():
             return ""
         
         try:
             prompt = f"""
 Generate a CSS selector for: {description}
 
-HTML sample:
+HTML structure (tags, classes and ids; text elided):
 ```html
-{html[:10000]}
+{_skeletonize(html)}
 ```
 
 Return only the CSS selector, nothing else. Make it as specific as needed but not overly complex.
 """
             
-            response = self.openai_client.chat.completions.create(
-                model=self.openai_model,
-                messages=[
-                    {"role": "system", "content": "You are a CSS selector expert. Return only the selector."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
+            selector = (self._ai_chat(
+                "You are a CSS selector expert. Return only the selector.",
+                prompt,
                 max_tokens=100
-            )
-            
-            selector = response.choices[0].message.content.strip()
+            ) or '').strip()
             print(f"AI generated selector: {selector}")
             return selector
             
@@ -1183,7 +2576,7 @@ Return only the CSS selector, nothing else. Make it as specific as needed but no
     
     def _ai_generate_json_path_patterns(self, structured_data: Dict, field_name: str) -> List[str]:
         """Use AI to generate JSON path patterns for structured data extraction"""
-        if not self.use_ai or not self.openai_client:
+        if not self.use_ai or not self._ensure_openai_client():
             return []
         
         try:
@@ -1201,28 +2594,14 @@ Examples: ["name", "brand.name", "offers.price", "sku", "mpn"]
 Consider common e-commerce schema.org patterns and variations.
 """
             
-            response = self.openai_client.chat.completions.create(
-                model=self.openai_model,
-                messages=[
-                    {"role": "system", "content": "You are a JSON path expert. Return only a JSON array of possible paths."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=200
-            )
-            
             try:
-                response_content = response.choices[0].message.content.strip()
-                
-                # Try to extract JSON array if it's wrapped in text
-                if '[' in response_content and ']' in response_content:
-                    json_start = response_content.find('[')
-                    json_end = response_content.rfind(']')
-                    json_content = response_content[json_start:json_end + 1]
-                else:
-                    json_content = response_content
-                
-                paths = json.loads(json_content)
+                response_content = (self._ai_chat(
+                    "You are a JSON path expert. Return only a JSON array of possible paths.",
+                    prompt,
+                    max_tokens=200
+                ) or '').strip()
+
+                paths = _extract_first_json(response_content)
                 if isinstance(paths, list):
                     print(f"AI generated {len(paths)} JSON paths for {field_name}")
                     return paths
@@ -1235,64 +2614,51 @@ Consider common e-commerce schema.org patterns and variations.
         return []
     
     def _extract_from_json_path(self, data: Dict, path: str) -> Any:
-        """Extract value from JSON using dot notation path"""
-        try:
-            keys = path.split('.')
-            current = data
-            
-            for key in keys:
-                if isinstance(current, dict):
-                    current = current.get(key)
-                elif isinstance(current, list) and current:
-                    # If it's a list, try the first item
-                    current = current[0].get(key) if isinstance(current[0], dict) else None
-                else:
-                    return None
-                    
-                if current is None:
-                    return None
-            
-            return current
-        except:
-            return None
+        """Extract value from JSON using dot notation path.
+
+        Hot inner loop (per product x field x candidate path): the split key
+        tuple is memoized and the walk uses exact type checks, which skip the
+        isinstance MRO lookup for the only two container types JSON has.
+        """
+        return _walk_json_path(data, path)
     
     def _generate_patterns_from_html(self, user_html: str) -> List[Dict]:
         """Generate product link patterns from user-provided HTML element"""
         patterns = []
         
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(user_html, 'html.parser')
-            
-            # Find the main container element
-            root_element = soup.find()
+            # No strainer here: the user's root container can be any tag and
+            # must survive the parse
+            soup = BeautifulSoup(user_html, _HTML_PARSER)
+
+            # Find the main container element (lxml wraps fragments in
+            # html/body, so look inside the body when one was added)
+            root_element = soup.body.find() if soup.body else soup.find()
             if not root_element:
                 return patterns
             
             # Generate CSS selector for this element
             css_selector = self._generate_css_selector_from_element(root_element)
             
-            # Look for links within the element
-            links = root_element.find_all('a', href=True)
-            
-            if links:
-                # Create pattern based on links found
-                for link in links:
-                    href = link.get('href', '')
-                    text = link.get_text(strip=True)
-                    
-                    if href and text:  # Only include links with both href and text
-                        pattern = {
-                            'pattern': f"{css_selector} a",
-                            'selector': f"{css_selector} a",
-                            'count': 1,  # Since this is from a single example
-                            'examples': [{'href': href, 'text': text}],
-                            'confidence': 0.8,  # High confidence since user-provided
-                            'type': 'user_generated'
-                        }
-                        patterns.append(pattern)
-                        break  # Use the first valid link pattern
-            
+            # Only the first href+text link matters, so scan the subtree
+            # lazily and stop there instead of materializing every link on a
+            # dense grid snippet with find_all
+            link = next(
+                (el for el in root_element.descendants
+                 if getattr(el, 'name', None) == 'a' and el.get('href') and el.get_text(strip=True)),
+                None
+            )
+            if link is not None:
+                pattern = {
+                    'pattern': f"{css_selector} a",
+                    'selector': f"{css_selector} a",
+                    'count': 1,  # Since this is from a single example
+                    'examples': [{'href': link['href'], 'text': link.get_text(strip=True)}],
+                    'confidence': 0.8,  # High confidence since user-provided
+                    'type': 'user_generated'
+                }
+                patterns.append(pattern)
+
             # If no links found, create a pattern for the container itself
             if not patterns:
                 pattern = {
@@ -1306,7 +2672,7 @@ Consider common e-commerce schema.org patterns and variations.
                 patterns.append(pattern)
                 
             # Use AI to improve the pattern if available
-            if self.use_ai and self.openai_client and patterns:
+            if self.use_ai and self._ensure_openai_client() and patterns:
                 improved_patterns = self._ai_improve_user_patterns(user_html, patterns)
                 if improved_patterns:
                     patterns = improved_patterns
@@ -1321,54 +2687,73 @@ Consider common e-commerce schema.org patterns and variations.
         field_patterns = {}
         
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(user_html, 'html.parser')
-            
-            # Define field detection strategies
-            field_strategies = {
-                'Product_Title': [
-                    {'tags': ['h1', 'h2', 'h3'], 'classes': ['title', 'name', 'product']},
-                    {'classes': ['product-title', 'product-name', 'item-title', 'title']}
-                ],
-                'Price': [
-                    {'classes': ['price', 'cost', 'amount']},
-                    {'tags': ['span', 'div'], 'content_patterns': [r'\$\d+', r'€\d+', r'£\d+']}
-                ],
-                'Brand': [
-                    {'classes': ['brand', 'manufacturer', 'make']},
-                    {'tags': ['span', 'div'], 'classes': ['brand']}
-                ]
-            }
-            
-            for field_name, strategies in field_strategies.items():
+            # Only the strained tags are ever queried below, so skip the rest
+            # of the snippet at parse time
+            soup = BeautifulSoup(user_html, _HTML_PARSER, parse_only=_USER_HTML_STRAINER)
+
+            # Collect the tree once and precompute each element's lowered
+            # class string; every strategy below reuses the pair instead of
+            # re-traversing and re-joining per tag per field. Tag-constrained
+            # strategies look up their candidates from the tag index rather
+            # than filtering the whole node list again
+            node_classes = []
+            tag_index = {}
+            for el in soup.find_all(True):
+                entry = (el, ' '.join(el.get('class') or ()).lower())
+                node_classes.append(entry)
+                tag_index.setdefault(el.name, []).append(entry)
+
+            # Selector strings per node id, shared across fields/strategies
+            selector_cache = {}
+
+            for field_name, strategies in _FIELD_STRATEGIES.items():
                 found_patterns = []
-                
+
                 for strategy in strategies:
                     elements = []
+                    class_re = strategy.get('class_re')
+                    content_re = strategy.get('content_re')
+                    tags = strategy.get('tags')
+
+                    if tags is not None:
+                        candidates = [entry for tag in tags
+                                      for entry in tag_index.get(tag, ())]
+                    else:
+                        candidates = node_classes
+
+                    for el, cls_lower in candidates:
+                        if class_re is not None:
+                            if not cls_lower or not class_re.search(cls_lower):
+                                continue
+                        elif content_re is not None:
+                            # One fused currency scan per node instead of a
+                            # regex pass per currency symbol
+                            if not content_re.search(el.get_text()):
+                                continue
+                        elif tags is None:
+                            continue
+                        elements.append(el)
                     
-                    # Find by tags and classes
-                    if 'tags' in strategy:
-                        for tag in strategy['tags']:
-                            tag_elements = soup.find_all(tag)
-                            if 'classes' in strategy:
-                                tag_elements = [el for el in tag_elements 
-                                              if any(cls in str(el.get('class', [])).lower() 
-                                                   for cls in strategy['classes'])]
-                            elements.extend(tag_elements)
-                    
-                    # Find by classes only
-                    elif 'classes' in strategy:
-                        for cls in strategy['classes']:
-                            elements.extend(soup.find_all(attrs={'class': lambda x: x and cls in str(x).lower()}))
-                    
-                    # Process found elements
+                    # Process found elements; an element matched by several
+                    # strategies gets its selector derived only once
                     for element in elements:
-                        css_selector = self._generate_css_selector_from_element(element)
-                        text_content = element.get_text(strip=True)
-                        
-                        if text_content and css_selector:
+                        # Leaf-like elements (the common case for these
+                        # fields) answer via .string without the full
+                        # subtree walk get_text does; textless elements are
+                        # skipped before any selector work
+                        text_content = (element.string or element.get_text(strip=True)).strip()
+                        if not text_content:
+                            continue
+
+                        el_id = id(element)
+                        css_selector = selector_cache.get(el_id)
+                        if css_selector is None:
+                            css_selector = self._generate_css_selector_from_element(element)
+                            selector_cache[el_id] = css_selector
+
+                        if css_selector:
                             pattern = {
-                                'regex': f'<{element.name}[^>]*>\\s*({re.escape(text_content)})\\s*</{element.name}>',
+                                'regex': _tag_text_regex(element.name, text_content),
                                 'css_selector': css_selector,
                                 'example_value': text_content,
                                 'confidence': 0.8,
@@ -1380,7 +2765,7 @@ Consider common e-commerce schema.org patterns and variations.
                     field_patterns[field_name] = found_patterns
                     
             # Use AI to improve field patterns if available
-            if self.use_ai and self.openai_client and field_patterns:
+            if self.use_ai and self._ensure_openai_client() and field_patterns:
                 improved_field_patterns = self._ai_improve_field_patterns(user_html, field_patterns)
                 if improved_field_patterns:
                     field_patterns = improved_field_patterns
@@ -1394,23 +2779,20 @@ Consider common e-commerce schema.org patterns and variations.
         """Generate a CSS selector for a given BeautifulSoup element"""
         try:
             selector_parts = []
-            
+
             # Start with tag name
             tag_name = element.name
-            
-            # Add class information if available
-            classes = element.get('class', [])
-            if classes:
-                # Use first class for specificity
-                main_class = classes[0]
-                selector_parts.append(f"{tag_name}.{main_class}")
+
+            # Add class information if available (first class for specificity)
+            if (classes := element.get('class')):
+                selector_parts.append(f"{tag_name}.{classes[0]}")
             else:
                 selector_parts.append(tag_name)
-            
-            # Add any unique attributes
-            for attr in ['id', 'data-id', 'data-product']:
-                if element.get(attr):
-                    attr_value = element.get(attr)
+
+            # Add any unique attributes; Tag.get is a linear attr scan, so
+            # look each one up once
+            for attr in _SELECTOR_ID_ATTRS:
+                if (attr_value := element.get(attr)):
                     selector_parts.append(f"[{attr}='{attr_value}']")
                     break
             
@@ -1421,7 +2803,7 @@ Consider common e-commerce schema.org patterns and variations.
     
     def _ai_improve_user_patterns(self, user_html: str, patterns: List[Dict]) -> List[Dict]:
         """Use AI to improve user-generated patterns"""
-        if not self.use_ai or not self.openai_client:
+        if not self.use_ai or not self._ensure_openai_client():
             return patterns
             
         try:
@@ -1432,7 +2814,7 @@ HTML Element:
 {user_html}
 
 Current Patterns:
-{json.dumps(patterns, indent=2)}
+{_json_dumps_compact(patterns)}
 
 Please provide improved CSS selectors that would be more robust and specific for finding similar product elements on the same website. Consider:
 1. Making selectors more specific but not overly rigid
@@ -1450,26 +2832,16 @@ Return as JSON array in this format:
 ]
 """
 
-            response = self.openai_client.chat.completions.create(
-                model=self.openai_model,
-                messages=[
-                    {"role": "system", "content": "You are an expert at CSS selectors and web scraping. Provide improved selectors in valid JSON format."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=1000
-            )
-            
-            content = response.choices[0].message.content.strip()
-            if '[' in content and ']' in content:
-                json_start = content.find('[')
-                json_end = content.rfind(']')
-                json_content = content[json_start:json_end + 1]
-                improved = json.loads(json_content)
-                
-                if isinstance(improved, list) and improved:
-                    print("[SUCCESS] AI improved the patterns")
-                    return improved
+            content = (self._ai_chat(
+                "You are an expert at CSS selectors and web scraping. Provide improved selectors in valid JSON format.",
+                prompt,
+                max_tokens=1000,
+                temperature=0.3
+            ) or '').strip()
+            improved = _extract_first_json(content)
+            if isinstance(improved, list) and improved:
+                print("[SUCCESS] AI improved the patterns")
+                return improved
                     
         except Exception as e:
             print(f"AI pattern improvement failed: {e}")
@@ -1478,7 +2850,7 @@ Return as JSON array in this format:
     
     def _ai_improve_field_patterns(self, user_html: str, field_patterns: Dict) -> Dict:
         """Use AI to improve field patterns extracted from user HTML"""
-        if not self.use_ai or not self.openai_client:
+        if not self.use_ai or not self._ensure_openai_client():
             return field_patterns
             
         try:
@@ -1489,7 +2861,7 @@ HTML Element:
 {user_html}
 
 Current Field Patterns:
-{json.dumps(field_patterns, indent=2)}
+{_json_dumps_compact(field_patterns)}
 
 Please provide improved regex patterns and CSS selectors for extracting product fields like title, price, brand, etc. Make the patterns more robust and flexible.
 
@@ -1508,26 +2880,17 @@ Return as JSON object in this format:
 }}
 """
 
-            response = self.openai_client.chat.completions.create(
-                model=self.openai_model,
-                messages=[
-                    {"role": "system", "content": "You are an expert at regex patterns and CSS selectors for web scraping. Provide improved patterns in valid JSON format."},
-                    {"role": "user", "content": prompt}
-                ],
+            content = (self._ai_chat(
+                "You are an expert at regex patterns and CSS selectors for web scraping. Provide improved patterns in valid JSON format.",
+                prompt,
+                max_tokens=1500,
                 temperature=0.3,
-                max_tokens=1500
-            )
-            
-            content = response.choices[0].message.content.strip()
-            if '{' in content and '}' in content:
-                json_start = content.find('{')
-                json_end = content.rfind('}')
-                json_content = content[json_start:json_end + 1]
-                improved = json.loads(json_content)
-                
-                if isinstance(improved, dict) and improved:
-                    print("[SUCCESS] AI improved the field patterns")
-                    return improved
+                json_mode=True
+            ) or '').strip()
+            improved = _extract_first_json(content)
+            if isinstance(improved, dict) and improved:
+                print("[SUCCESS] AI improved the field patterns")
+                return improved
                     
         except Exception as e:
             print(f"AI field pattern improvement failed: {e}")
@@ -1536,10 +2899,14 @@ Return as JSON object in this format:
     
     def _fetch_with_requests(self, url: str, timeout: int = 20) -> Optional[str]:
         """Fetch page using requests with advanced protection bypass attempts"""
-        # Create a session for better cookie/state management
-        session = requests.Session()
-        
-        # Enhanced approaches with different header combinations
+        # All approaches hit the same origin, so reuse the pooled analyzer
+        # session - a per-call Session() repaid the TCP+TLS handshake for
+        # every one of the 5 retry approaches
+        session = self.session
+
+        # Enhanced approaches with different header combinations; the static
+        # header blocks live on the class / instance, so only the random
+        # User-Agent is picked fresh per call
         approaches = [
             # Standard approach
             {
@@ -1555,221 +2922,114 @@ Return as JSON object in this format:
             },
             # With additional security headers
             {
-                'headers': {
-                    **self._get_random_headers(),
-                    'Referer': self.base_url,
-                    'Origin': self.base_url,
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'same-origin',
-                    'Sec-Fetch-User': '?1'
-                },
+                'headers': {**self._get_random_headers(), **self._security_header_extras},
                 'allow_redirects': True,
                 'timeout': timeout
             },
             # Chrome-like headers
             {
-                'headers': {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0',
-                    'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-                    'sec-ch-ua-mobile': '?0',
-                    'sec-ch-ua-platform': '"Windows"'
-                },
+                'headers': self._CHROME_HEADERS,
                 'allow_redirects': True,
                 'timeout': timeout
             }
         ]
-        
-        # Add proxy approach if available
-        if self.proxies:
-            proxy = self.proxies[0]  # Only one proxy (Webshare)
-            
-            # Format Webshare proxy for requests
-            proxy_url = f"http://{proxy['username']}:{proxy['password']}@{proxy['server'].replace('http://', '')}"
-            proxy_dict = {
-                'http': proxy_url,
-                'https': proxy_url
-            }
-            
+
+        # Add proxy approach if available (proxy mapping is prebuilt in __init__)
+        if self.proxies and self._requests_proxy_dict:
             approaches.append({
                 'headers': self._get_random_headers(),
-                'proxies': proxy_dict,
+                'proxies': self._requests_proxy_dict,
                 'allow_redirects': True,
                 'timeout': timeout
             })
         
-        for i, approach in enumerate(approaches):
-            try:
-                print(f"Trying approach {i+1} for {url}")
-                # Add random delay to seem more human
-                time.sleep(random.uniform(0.5, 2.0))
-                
+        http2_client = self._http2_client
+
+        def attempt(i: int, approach: Dict[str, Any]) -> Optional[str]:
+            if http2_client is not None and 'proxies' not in approach:
+                # The h2 client multiplexes the racing approaches over one
+                # TLS connection instead of one HTTP/1.1 connection each;
+                # the proxy approach stays on requests because httpx pins
+                # proxies at client construction
+                response = http2_client.get(url, headers=approach['headers'],
+                                            timeout=approach['timeout'])
+            else:
                 response = session.get(url, **approach)
-                print(f"Approach {i+1}: status {response.status_code}, content length: {len(response.text)}")
-                
-                # Check for protection pages
-                if self._is_protection_page(response.text):
-                    print(f"Protection detected on approach {i+1}")
-                    continue
-                
-                response.raise_for_status()
-                
-                # Additional validation
-                if len(response.text) < 500:  # Too short might be error page
-                    print(f"Response too short ({len(response.text)} chars) on approach {i+1}")
-                    continue
-                
-                print_success(f"Successfully fetched with approach {i+1} ({len(response.text)} characters)")
-                return response.text
-                
+            print(f"Approach {i}: status {response.status_code}, content length: {len(response.text)}")
+
+            # Check for protection pages
+            if self._is_protection_page(response.text):
+                print(f"Protection detected on approach {i}")
+                return None
+
+            response.raise_for_status()
+
+            # Additional validation
+            if len(response.text) < 500:  # Too short might be error page
+                print(f"Response too short ({len(response.text)} chars) on approach {i}")
+                return None
+
+            return response.text
+
+        # Politeness is paid once per URL from the host bucket, not per
+        # approach; successive pages of the same site only sleep when they
+        # arrive faster than the budget allows
+        host = _domain_from_url(url)
+        now = time.monotonic()
+        wait = self._host_next_allowed.get(host, 0.0) - now
+        if wait > 0:
+            time.sleep(wait)
+        self._host_next_allowed[host] = now + max(wait, 0.0) + _HOST_MIN_INTERVAL
+
+        # Fast path: lead with the approach that already worked for this
+        # host and only race the full set if it stops working
+        preferred = self._req_approach_memory.get(host)
+        if preferred is not None and preferred < len(approaches):
+            try:
+                print(f"Trying remembered approach {preferred + 1} for {url}")
+                text = attempt(preferred + 1, approaches[preferred])
             except Exception as e:
-                print(f"Approach {i+1} failed: {e}")
-                continue
-        
-        session.close()
+                print(f"Remembered approach {preferred + 1} failed: {e}")
+                text = None
+            if text:
+                print_success(f"Successfully fetched with remembered approach {preferred + 1} ({len(text)} characters)")
+                return text
+
+        # Race the approaches instead of paying their timeouts (and the old
+        # inter-approach sleeps) in sequence; the pooled session handles
+        # concurrent GETs, and the first valid response wins
+        print(f"Trying {len(approaches)} request approaches concurrently for {url}")
+        executor = ThreadPoolExecutor(max_workers=len(approaches))
+        try:
+            futures = {
+                executor.submit(attempt, i + 1, approach): i + 1
+                for i, approach in enumerate(approaches)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    text = future.result()
+                except Exception as e:
+                    print(f"Approach {i} failed: {e}")
+                    continue
+                if text:
+                    print_success(f"Successfully fetched with approach {i} ({len(text)} characters)")
+                    self._req_approach_memory[host] = i - 1
+                    return text
+        finally:
+            # Don't block the caller on losing attempts still waiting on
+            # their timeouts; they are dropped as they finish
+            executor.shutdown(wait=False, cancel_futures=True)
+
         return None
     
     def _get_playwright_stealth_script(self) -> str:
         """Get advanced Playwright stealth script from the proven working implementation"""
-        return """
-        // Advanced Playwright stealth script for bypassing bot detection
-        
-        // Hide webdriver property
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined,
-        });
-        
-        // Override navigator properties
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [
-                {name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer'},
-                {name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai'},
-                {name: 'Native Client', filename: 'internal-nacl-plugin'}
-            ],
-        });
-        
-        Object.defineProperty(navigator, 'languages', {
-            get: () => ['en-US', 'en'],
-        });
-        
-        Object.defineProperty(navigator, 'permissions', {
-            get: () => ({
-                query: () => Promise.resolve({ state: 'granted' })
-            }),
-        });
-        
-        // Add chrome runtime
-        window.chrome = {
-            runtime: {
-                onConnect: undefined,
-                onMessage: undefined,
-                connect: () => ({
-                    onMessage: {
-                        addListener: () => {},
-                        removeListener: () => {}
-                    },
-                    postMessage: () => {},
-                    disconnect: () => {}
-                })
-            },
-            app: {
-                isInstalled: false
-            }
-        };
-        
-        // Hardware properties
-        Object.defineProperty(navigator, 'hardwareConcurrency', {
-            get: () => Math.floor(Math.random() * 4) + 4, // 4-8 cores
-        });
-        
-        Object.defineProperty(navigator, 'deviceMemory', {
-            get: () => Math.pow(2, Math.floor(Math.random() * 3) + 2), // 4, 8, or 16 GB
-        });
-        
-        // Platform consistency
-        Object.defineProperty(navigator, 'platform', {
-            get: () => 'Win32',
-        });
-        
-        // Override automation-specific properties
-        delete navigator.__proto__.webdriver;
-        
-        // Spoof canvas fingerprinting
-        const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-        const originalGetImageData = CanvasRenderingContext2D.prototype.getImageData;
-        
-        HTMLCanvasElement.prototype.toDataURL = function(type) {
-            const shift = Math.floor(Math.random() * 10) - 5;
-            const canvas = this;
-            const ctx = canvas.getContext('2d');
-            const originalData = ctx.getImageData(0, 0, canvas.width, canvas.height);
-            
-            // Add slight noise
-            for (let i = 0; i < originalData.data.length; i += 4) {
-                originalData.data[i] += shift;
-                originalData.data[i + 1] += shift;
-                originalData.data[i + 2] += shift;
-            }
-            
-            ctx.putImageData(originalData, 0, 0);
-            return originalToDataURL.apply(this, arguments);
-        };
-        
-        // Mouse movement simulation
-        let mouseEvents = [];
-        document.addEventListener('mousemove', (e) => {
-            mouseEvents.push({x: e.clientX, y: e.clientY, time: Date.now()});
-            if (mouseEvents.length > 100) mouseEvents.shift();
-        });
-        
-        // Random mouse movements
-        function simulateMouseMovement() {
-            const event = new MouseEvent('mousemove', {
-                clientX: Math.random() * window.innerWidth,
-                clientY: Math.random() * window.innerHeight,
-                bubbles: true
-            });
-            document.dispatchEvent(event);
-        }
-        
-        // Simulate human-like behavior
-        setTimeout(() => {
-            for (let i = 0; i < 5; i++) {
-                setTimeout(simulateMouseMovement, Math.random() * 2000);
-            }
-        }, Math.random() * 1000);
-        
-        // Override toString methods
-        navigator.webdriver = undefined;
-        Object.defineProperty(Object.getPrototypeOf(navigator), 'webdriver', {
-            set: undefined,
-            enumerable: false,
-            configurable: false
-        });
-        """
+        return _PLAYWRIGHT_STEALTH_SCRIPT
     
     def _get_random_user_agent(self) -> str:
         """Get a random realistic user agent from proven working list"""
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/120.0.0.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15"
-        ]
-        return random.choice(user_agents)
+        return self._rng.choice(_USER_AGENTS)
     
     def _fetch_with_playwright_extended_wait(self, url: str) -> Optional[str]:
         """Fetch page using Playwright with extended waits for SPA/dynamic content"""
@@ -1890,364 +3150,244 @@ Return as JSON object in this format:
             except Exception as e:
                 print(f"Remembered subprocess approach failed: {e}")
         # Try all 4 approaches: headless+no-proxy, headless+proxy, non-headless+no-proxy, non-headless+proxy
-        approaches = [
-            {'headless': True, 'use_proxy': False, 'label': 'headless + no proxy'},
-            {'headless': True, 'use_proxy': True, 'label': 'headless + proxy'}, 
-            {'headless': False, 'use_proxy': False, 'label': 'non-headless + no proxy'},
-            {'headless': False, 'use_proxy': True, 'label': 'non-headless + proxy'}
-        ]
-        
-        for approach in approaches:
-            headless_mode = approach['headless']
-            use_proxy = approach['use_proxy']
+        # Browsers are shared per launch flavor across calls (Chromium boot
+        # is 1-3s); each attempt only opens and closes a cheap context
+        for headless_mode in (True, False):
             try:
-                print(f"Trying Playwright {approach['label']} mode for {url}")
-                # Note: Skip event loop cleanup as it causes conflicts
-                # The subprocess fallback handles event loop issues automatically
-                
-                with sync_playwright() as p:
-                    if fast_mode:
-                        # Fast mode: minimal arguments for speed
-                        browser_args = [
-                            '--no-sandbox',
-                            '--disable-dev-shm-usage',
-                            '--disable-extensions'
-                        ]
-                        selected_viewport = {"width": 1920, "height": 1080}
-                        slow_mo_delay = 0  # No delay for fast mode
+                browser = self._get_fetch_browser(headless_mode, fast_mode)
+            except Exception as e:
+                print(f"Playwright {'headless' if headless_mode else 'non-headless'} launch failed: {e}")
+                continue
+
+            # Viewport stays per call even though the browser is shared
+            selected_viewport = _VIEWPORTS[0] if fast_mode else self._rng.choice(_VIEWPORTS)
+
+            for use_proxy in (False, True):
+                label = f"{'headless' if headless_mode else 'non-headless'} + {'proxy' if use_proxy else 'no proxy'}"
+                context = None
+                try:
+                    print(f"Trying Playwright {label} mode for {url}")
+
+                    # Setup proxy if this approach uses proxy
+                    proxy_dict = None
+                    if use_proxy and self.proxies:
+                        proxy = self.proxies[0]  # Only one proxy (Webshare)
+
+                        # Configure Webshare proxy for Playwright
+                        proxy_dict = {
+                            "server": proxy['server'],
+                            "username": proxy['username'],
+                            "password": proxy['password']
+                        }
+                        print(f"Using Playwright Webshare proxy: {proxy['server']}")
                     else:
-                        # Stealth mode: full anti-detection (for full analysis)
-                        browser_args = [
-                            '--no-sandbox',
-                            '--disable-blink-features=AutomationControlled',
-                            '--exclude-switches=enable-automation',
-                            '--disable-web-security',
-                            '--disable-extensions',
-                            '--disable-plugins',
-                            '--disable-background-timer-throttling',
-                            '--disable-renderer-backgrounding',
-                            '--disable-backgrounding-occluded-windows',
-                            '--disable-default-apps',
-                            '--disable-sync',
-                            '--disable-translate',
-                            '--hide-scrollbars',
-                            '--mute-audio',
-                            '--no-default-browser-check',
-                            '--disable-ipc-flooding-protection',
-                            '--password-store=basic',
-                            '--use-mock-keychain',
-                            '--disable-dev-shm-usage',
-                            '--disable-field-trial-config',
-                            '--no-first-run',
-                            '--disable-background-networking',
-                            '--disable-client-side-phishing-detection',
-                            '--disable-component-extensions-with-background-pages',
-                            '--disable-domain-reliability',
-                            '--disable-features=TranslateUI',
-                            '--force-color-profile=srgb',
-                            '--metrics-recording-only',
-                            '--safebrowsing-disable-auto-update'
-                        ]
-                        # Random viewport dimensions
-                        viewports = [
-                            {"width": 1920, "height": 1080},
-                            {"width": 1366, "height": 768},
-                            {"width": 1536, "height": 864},
-                            {"width": 1440, "height": 900},
-                            {"width": 1600, "height": 900}
-                        ]
-                        selected_viewport = random.choice(viewports)
-                        slow_mo_delay = random.randint(50, 150)
-                    
-                    # Launch browser
-                    browser = p.chromium.launch(
-                        headless=headless_mode,
-                        args=browser_args,
-                        slow_mo=slow_mo_delay,
-                        devtools=False
-                    )
-                
-                # Setup proxy if this approach uses proxy
-                proxy_dict = None
-                if use_proxy and self.proxies:
-                    proxy = self.proxies[0]  # Only one proxy (Webshare)
-                    
-                    # Configure Webshare proxy for Playwright
-                    proxy_dict = {
-                        "server": proxy['server'],
-                        "username": proxy['username'], 
-                        "password": proxy['password']
-                    }
-                    print(f"Using Playwright Webshare proxy: {proxy['server']}")
-                else:
-                    print(f"Running without proxy")
-                # Context arguments (fast vs stealth mode)
-                if fast_mode:
-                    # Fast mode: minimal context setup
-                    context_args = {
-                        "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                        "viewport": selected_viewport
-                    }
-                else:
-                    # Stealth mode: full anti-detection
-                    timezones = [
-                        "America/New_York",
-                        "America/Chicago", 
-                        "America/Denver",
-                        "America/Los_Angeles",
-                        "Europe/London",
-                        "Europe/Berlin"
-                    ]
-                    
-                    context_args = {
-                        "user_agent": self._get_random_user_agent(),
-                        "viewport": selected_viewport,
-                        "locale": random.choice(["en-US", "en-GB", "en-CA"]),
-                        "timezone_id": random.choice(timezones),
-                        "permissions": ["geolocation", "notifications"],
-                        "geolocation": {
-                            "latitude": round(random.uniform(25, 48), 6),
-                            "longitude": round(random.uniform(-125, -65), 6),
-                            "accuracy": random.randint(100, 1000)
-                        },
-                        "color_scheme": random.choice(["light", "dark", "no-preference"]),
-                        "reduced_motion": random.choice(["reduce", "no-preference"]),
-                        "forced_colors": random.choice(["active", "none"]),
-                        "extra_http_headers": {
-                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                        "Accept-Language": "en-US,en;q=0.9",
-                        "Accept-Encoding": "gzip, deflate, br",
-                        "Connection": "keep-alive",
-                        "Upgrade-Insecure-Requests": "1",
-                        "Sec-Fetch-Dest": "document",
-                        "Sec-Fetch-Mode": "navigate",
-                        "Sec-Fetch-Site": "none",
-                        "Sec-Fetch-User": "?1",
-                        "Cache-Control": "max-age=0",
-                        "DNT": "1",
-                        "Sec-Ch-Ua": f'"Not_A Brand";v="8", "Chromium";v="{random.randint(110, 125)}", "Google Chrome";v="{random.randint(110, 125)}"',
-                        "Sec-Ch-Ua-Mobile": "?0",
-                        "Sec-Ch-Ua-Platform": f'"{random.choice(["Windows", "macOS", "Linux"])}"',
-                        "Sec-Ch-Ua-Platform-Version": f'"{random.randint(10, 15)}.{random.randint(0, 9)}.{random.randint(0, 9)}"'
-                    }
-                }
-                
-                if proxy_dict:
-                    context_args["proxy"] = proxy_dict
-                
-                context = browser.new_context(**context_args)
-                
-                # Add stealth scripts only in stealth mode
-                if not fast_mode:
-                    context.add_init_script(self._get_playwright_stealth_script())
-                
-                # Additional fingerprint randomization
-                random_height_offset = random.randint(30, 80)
-                random_graphics_number = random.randint(5000, 6000)
-                
-                context.add_init_script(f"""
-                    // Randomize screen properties
-                    Object.defineProperty(screen, 'width', {{
-                        get: () => {selected_viewport["width"]}
-                    }});
-                    Object.defineProperty(screen, 'height', {{
-                        get: () => {selected_viewport["height"]}
-                    }});
-                    Object.defineProperty(screen, 'availWidth', {{
-                        get: () => {selected_viewport["width"]}
-                    }});
-                    Object.defineProperty(screen, 'availHeight', {{
-                        get: () => {selected_viewport["height"] - random_height_offset}
-                    }});
-                    
-                    // Randomize WebGL properties
-                    const getParameter = WebGLRenderingContext.prototype.getParameter;
-                    WebGLRenderingContext.prototype.getParameter = function(parameter) {{
-                        if (parameter === 37445) {{
-                            return 'Intel Inc.';
-                        }}
-                        if (parameter === 37446) {{
-                            return 'Intel(R) Iris(TM) Graphics {random_graphics_number}';
-                        }}
-                        return getParameter.call(this, parameter);
-                    }};
-                """)
-                
-                page = context.new_page()
-                
-                # Multi-strategy navigation like in the working script
-                success = self._playwright_navigate_with_retry(page, url)
-                
-                if success:
-                    # Wait for complete page load after navigation
-                    page.wait_for_load_state('domcontentloaded')
-                    
-                    # Wait for network activity to settle
-                    try:
-                        page.wait_for_load_state('networkidle', timeout=10000)
-                    except:
-                        # If networkidle fails, wait for dynamic content
-                        page.wait_for_timeout(5000)
-                    
-                    # Additional wait to ensure all content is loaded
-                    page.wait_for_timeout(3000)
-                    
-                    # Simulate human-like behavior
-                    self._simulate_human_behavior(page)
-                    
-                    # Get page content
-                    html = page.content()
-                    
-                    # Check if we got a valid page
-                    if not self._is_protection_page(html):
-                        print_success(f"Successfully fetched page with Playwright {approach['label']} mode ({len(html)} characters)")
-                        browser.close()
-                        return html
+                        print(f"Running without proxy")
+
+                    # Context arguments (fast vs stealth mode)
+                    if fast_mode:
+                        # Fast mode: minimal context setup
+                        context_args = {
+                            "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                            "viewport": selected_viewport
+                        }
                     else:
-                        print(f"Still seeing protection page after Playwright {approach['label']} bypass")
-                        browser.close()
-                
-            except Exception as e:
-                if 'browser' in locals():
-                    try:
-                        browser.close()
-                    except:
-                        pass
-                print(f"Playwright {approach['label']} mode failed: {e}")
-                # If it's an event loop error, immediately use subprocess approach
-                if "Event loop is closed" in str(e) or "event loop" in str(e).lower():
-                    print(f"Event loop conflict detected, using subprocess approach for {approach['label']} mode")
-                    try:
-                        html = self._fetch_playwright_subprocess(url, headless_mode)
-                        if html and not self._is_protection_page(html):
-                            print(f"SUCCESS with Playwright subprocess {approach['label']} mode!")
-                            # Record this success in approach memory
-                            if hasattr(self, 'approach_memory'):
-                                self.approach_memory.record_successful_approach(url, 'playwright_subprocess')
+                        # Stealth mode: full anti-detection
+                        context_args = {
+                            "user_agent": self._get_random_user_agent(),
+                            "viewport": selected_viewport,
+                            "locale": self._rng.choice(_LOCALES),
+                            "timezone_id": self._rng.choice(_TIMEZONES),
+                            "permissions": ["geolocation", "notifications"],
+                            "geolocation": {
+                                "latitude": round(self._rng.uniform(25, 48), 6),
+                                "longitude": round(self._rng.uniform(-125, -65), 6),
+                                "accuracy": self._rng.randint(100, 1000)
+                            },
+                            "color_scheme": self._rng.choice(["light", "dark", "no-preference"]),
+                            "reduced_motion": self._rng.choice(["reduce", "no-preference"]),
+                            "forced_colors": self._rng.choice(["active", "none"]),
+                            "extra_http_headers": {
+                                **_STEALTH_CONTEXT_HEADERS,
+                                "Sec-Ch-Ua": f'"Not_A Brand";v="8", "Chromium";v="{self._rng.randint(110, 125)}", "Google Chrome";v="{self._rng.randint(110, 125)}"',
+                                "Sec-Ch-Ua-Mobile": "?0",
+                                "Sec-Ch-Ua-Platform": f'"{self._rng.choice(["Windows", "macOS", "Linux"])}"',
+                                "Sec-Ch-Ua-Platform-Version": f'"{self._rng.randint(10, 15)}.{self._rng.randint(0, 9)}.{self._rng.randint(0, 9)}"'
+                            }
+                        }
+
+                    if proxy_dict:
+                        context_args["proxy"] = proxy_dict
+
+                    context = browser.new_context(**context_args)
+
+                    # Add stealth scripts only in stealth mode
+                    if not fast_mode:
+                        context.add_init_script(path=_init_script_path(_PLAYWRIGHT_STEALTH_SCRIPT))
+
+                    # Additional fingerprint randomization
+                    context.add_init_script(_FINGERPRINT_TEMPLATE.substitute(
+                        width=selected_viewport["width"],
+                        height=selected_viewport["height"],
+                        avail_height=selected_viewport["height"] - self._rng.randint(30, 80),
+                        graphics_number=self._rng.randint(5000, 6000),
+                    ))
+
+                    page = context.new_page()
+
+                    # Multi-strategy navigation like in the working script
+                    success = self._playwright_navigate_with_retry(page, url)
+
+                    if success:
+                        # DOM ready is enough here; networkidle rarely fires
+                        # on ad-heavy pages and just burns its full timeout
+                        page.wait_for_load_state('domcontentloaded')
+
+                        # Brief settle for late-loading dynamic content
+                        page.wait_for_timeout(3000)
+
+                        # Simulate human-like behavior
+                        self._simulate_human_behavior(page)
+
+                        # Get page content
+                        html = page.content()
+
+                        # Check if we got a valid page
+                        if not self._is_protection_page(html):
+                            print_success(f"Successfully fetched page with Playwright {label} mode ({len(html)} characters)")
                             return html
-                    except Exception as subprocess_error:
-                        print(f"Subprocess approach failed: {subprocess_error}")
-                continue
-        
+                        else:
+                            print(f"Still seeing protection page after Playwright {label} bypass")
+
+                except Exception as e:
+                    print(f"Playwright {label} mode failed: {e}")
+                    # If it's an event loop error, immediately use subprocess approach
+                    if "Event loop is closed" in str(e) or "event loop" in str(e).lower():
+                        print(f"Event loop conflict detected, using subprocess approach for {label} mode")
+                        try:
+                            html = self._fetch_playwright_subprocess(url, headless_mode)
+                            if html and not self._is_protection_page(html):
+                                print(f"SUCCESS with Playwright subprocess {label} mode!")
+                                # Record this success in approach memory
+                                if hasattr(self, 'approach_memory'):
+                                    self.approach_memory.record_successful_approach(url, 'playwright_subprocess')
+                                return html
+                        except Exception as subprocess_error:
+                            print(f"Subprocess approach failed: {subprocess_error}")
+                finally:
+                    if context is not None:
+                        try:
+                            context.close()
+                        except Exception:
+                            pass
         # If all 4 approaches failed
         print_error("All 4 Playwright approaches failed (headless+no-proxy, headless+proxy, non-headless+no-proxy, non-headless+proxy)")
         return None
-                
-    def _fetch_playwright_subprocess(self, url: str, headless: bool = True) -> Optional[str]:
-        """Fallback: Run Playwright in a subprocess to avoid event loop conflicts"""
+
+    def _get_pw_worker(self):
+        """Return the persistent Playwright worker process, spawning it on
+        first use (or respawning it if it died)"""
         import subprocess
-        import tempfile
-        import json
-        import os
-        import sys
-        
-        try:
-            # Create a temporary script to run Playwright
-            script_content = f'''
-import sys
-from playwright.sync_api import sync_playwright
-import json
 
-def fetch_with_playwright():
-    try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless={headless},
-                args=['--no-sandbox', '--disable-setuid-sandbox']
-            )
-            context = browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            page = context.new_page()
-            page.goto("{url}", wait_until="load", timeout=60000)
-            page.wait_for_load_state('domcontentloaded')
-            try:
-                page.wait_for_load_state('networkidle', timeout=10000)
-            except:
-                page.wait_for_timeout(5000)
-            page.wait_for_timeout(3000)
-            
-            html = page.content()
-            browser.close()
-            return html
-        except Exception as e:
-        print(f"Error: {{e}}", file=sys.stderr)
-        return None
+        if self._pw_worker is not None and self._pw_worker.poll() is None:
+            return self._pw_worker
 
-result = fetch_with_playwright()
-if result:
-    # Ensure UTF-8 output to handle Unicode characters
-    import sys
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-    print(result)
-'''
-            
-            # Write script to temporary file with UTF-8 encoding
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as f:
-                f.write(script_content)
-                script_path = f.name
-            
-            # Set environment for UTF-8 handling
-            env = os.environ.copy()
-            env['PYTHONIOENCODING'] = 'utf-8'
-            
-            # Run the script in a subprocess with UTF-8 encoding
-            result = subprocess.run(
-                [sys.executable, script_path],
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',  # Replace problematic characters
-                env=env,
-                timeout=120  # 2 minutes timeout
-            )
-            
-            # Clean up temporary file
+        env = os.environ.copy()
+        env['PYTHONIOENCODING'] = 'utf-8'
+        self._pw_worker = subprocess.Popen(
+            [sys.executable, '-u', _init_script_path(_PW_WORKER_SCRIPT, '.py')],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            env=env
+        )
+        return self._pw_worker
+
+    def _stop_pw_worker(self):
+        """Ask the worker to quit cleanly; terminate it if it won't"""
+        proc = self._pw_worker
+        if proc is None or proc.poll() is not None:
+            return
+        try:
+            proc.stdin.write('{"cmd":"quit"}\n')
+            proc.stdin.flush()
+            proc.wait(timeout=5)
+        except Exception:
             try:
-                os.unlink(script_path)
-            except:
+                proc.terminate()
+            except Exception:
                 pass
-            
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
-            else:
-                print(f"Subprocess failed: {result.stderr}")
+
+    def _fetch_playwright_subprocess(self, url: str, headless: bool = True) -> Optional[str]:
+        """Fallback: fetch through a persistent Playwright worker process.
+
+        The worker keeps one interpreter and one browser per headless mode
+        alive across calls, so only the first fetch pays interpreter import
+        and Chromium cold start; later fetches just open a fresh context.
+        Running it out-of-process still sidesteps the event-loop conflicts
+        this fallback exists for.
+        """
+        import queue
+
+        try:
+            proc = self._get_pw_worker()
+            proc.stdin.write(json.dumps({'url': url, 'headless': headless}) + '\n')
+            proc.stdin.flush()
+
+            # Bound the wait so a wedged worker can't hang the caller; the
+            # reader thread works on pipes everywhere (select() would only
+            # handle sockets on Windows), and a timed-out worker is killed
+            # and respawned on the next call
+            reply: queue.Queue = queue.Queue(maxsize=1)
+            reader = threading.Thread(
+                target=lambda: reply.put(proc.stdout.readline()), daemon=True)
+            reader.start()
+            try:
+                line = reply.get(timeout=90)
+            except queue.Empty:
+                print("Playwright worker timed out, restarting it")
+                proc.kill()
                 return None
-                
+
+            if not line:
+                print("Playwright worker exited unexpectedly")
+                return None
+
+            result = json.loads(line)
+            if result.get('error'):
+                print(f"Playwright worker fetch failed: {result['error']}")
+            return result.get('html')
+
         except Exception as e:
-            print(f"Subprocess execution failed: {e}")
+            print(f"Playwright worker execution failed: {e}")
             return None
-    
+
     def _playwright_navigate_with_retry(self, page, url: str, max_retries: int = 3) -> bool:
         """Navigate with advanced retry strategies from the working script"""
         
-        # Different referrer strategies
-        referrers = [
-            "https://www.google.com/",
-            "https://www.bing.com/",
-            "https://duckduckgo.com/",
-            "https://www.yahoo.com/",
-            None  # Direct access
-        ]
-        
         for attempt in range(max_retries):
             try:
                 print(f"Playwright attempt {attempt + 1}/{max_retries} for URL: {url}")
+                # Escalating navigation budget: fail fast on the first try,
+                # only grant the full 60s once cheaper attempts have timed out
+                nav_timeout = (15000, 30000, 60000)[min(attempt, 2)]
                 # Progressive delay between attempts
                 if attempt > 0:
-                    delay = random.uniform(3, 8) * (attempt + 1)
+                    delay = self._rng.uniform(3, 8) * (attempt + 1)
                     print(f"Waiting {delay:.1f} seconds before retry...")
                     time.sleep(delay)
-                
+
                 # Strategy 1: Direct navigation
                 if attempt == 0:
                     print("Strategy: Direct navigation")
-                    response = page.goto(url, timeout=60000, wait_until="load")
+                    response = page.goto(url, timeout=nav_timeout, wait_until="load")
                 
                 # Strategy 2: Navigate via homepage first
                 elif attempt == 1:
                     print("Strategy: Navigate via homepage and build session")
-                    parsed = urlparse(url)
+                    parsed = _parse_url(url)
                     homepage = f"{parsed.scheme}://{parsed.netloc}"
                     
                     try:
@@ -2256,24 +3396,24 @@ if result:
                         home_response = page.goto(homepage, timeout=30000, wait_until="load")
                         if home_response.status == 200:
                             print("Homepage loaded successfully")
-                            time.sleep(random.uniform(2, 4))
-                            response = page.goto(url, timeout=60000, wait_until="load")
+                            time.sleep(self._rng.uniform(2, 4))
+                            response = page.goto(url, timeout=nav_timeout, wait_until="load")
                         else:
-                            response = page.goto(url, timeout=60000, wait_until="load")
+                            response = page.goto(url, timeout=nav_timeout, wait_until="load")
                     except Exception as e:
                         print(f"Homepage strategy error: {e}")
-                        response = page.goto(url, timeout=60000, wait_until="load")
+                        response = page.goto(url, timeout=nav_timeout, wait_until="load")
                 
                 # Strategy 3: Simulate search engine click
                 else:
                     print("Strategy: Simulate search engine referral")
                     try:
-                        google_url = f"https://www.google.com/search?q=site:{urlparse(url).netloc}"
+                        google_url = f"https://www.google.com/search?q=site:{_parse_url(url).netloc}"
                         page.goto(google_url, timeout=30000, wait_until="load")
-                        time.sleep(random.uniform(2, 4))
-                        response = page.goto(url, timeout=60000, wait_until="load")
+                        time.sleep(self._rng.uniform(2, 4))
+                        response = page.goto(url, timeout=nav_timeout, wait_until="load")
                     except:
-                        response = page.goto(url, timeout=60000, wait_until="load")
+                        response = page.goto(url, timeout=nav_timeout, wait_until="load")
                 
                 # Check response status
                 if response and response.status == 200:
@@ -2306,33 +3446,12 @@ if result:
     def _simulate_human_behavior(self, page):
         """Simulate human-like behavior on the page"""
         try:
-            # Random initial wait (like a human reading)
-            initial_wait = random.uniform(1, 3)
-            time.sleep(initial_wait)
-            
-            # Simulate mouse movements
-            for i in range(random.randint(2, 4)):
-                x = random.randint(100, 800)
-                y = random.randint(100, 600)
-                page.mouse.move(x, y)
-                time.sleep(random.uniform(0.2, 0.5))
-            
-            # Random scrolling behavior
-            scroll_count = random.randint(1, 3)
-            for i in range(scroll_count):
-                scroll_distance = random.randint(200, 600)
-                page.evaluate(f"window.scrollBy(0, {scroll_distance})")
-                time.sleep(random.uniform(0.5, 1.5))
-                
-                # Sometimes scroll back up
-                if random.random() > 0.7:
-                    page.evaluate(f"window.scrollBy(0, -{scroll_distance // 2})")
-                    time.sleep(random.uniform(0.3, 0.8))
-            
-            # Scroll back to top
-            page.evaluate("window.scrollTo(0, 0)")
-            time.sleep(random.uniform(0.5, 1))
-            
+            # Short reading pause on the Playwright loop, then the whole
+            # randomized scroll sequence runs inside the page as one
+            # evaluate call instead of a dozen CDP round-trips separated
+            # by Python-side sleeps
+            page.wait_for_timeout(1500)
+            page.evaluate(_HUMAN_BEHAVIOR_JS)
         except Exception as e:
             print(f"Human behavior simulation error (continuing): {e}")
     def _fetch_with_selenium(self, url: str) -> Optional[str]:
@@ -2348,44 +3467,7 @@ if result:
                 options = uc.ChromeOptions()
                 
                 # Advanced stealth arguments
-                stealth_args = [
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security',
-                    '--disable-extensions',
-                    '--disable-plugins',
-                    '--disable-background-timer-throttling',
-                    '--disable-renderer-backgrounding',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-default-apps',
-                    '--disable-sync',
-                    '--disable-translate',
-                    '--hide-scrollbars',
-                    '--mute-audio',
-                    '--no-default-browser-check',
-                    '--disable-ipc-flooding-protection',
-                    '--password-store=basic',
-                    '--use-mock-keychain',
-                    '--disable-background-networking',
-                    '--disable-default-apps',
-                    '--disable-dev-shm-usage',
-                    '--disable-features=VizDisplayCompositor,TranslateUI',
-                    '--disable-hang-monitor',
-                    '--disable-prompt-on-repost',
-                    '--disable-component-update',
-                    '--no-first-run',
-                    '--no-default-browser-check',
-                    '--disable-logging',
-                    '--disable-background-timer-throttling',
-                    '--disable-breakpad',
-                    '--disable-client-side-phishing-detection',
-                    '--disable-crash-reporter',
-                    '--disable-extensions-file-access-check',
-                    '--disable-extensions-http-throttling'
-                ]
-                
-                for arg in stealth_args:
+                for arg in _SELENIUM_STEALTH_ARGS:
                     options.add_argument(arg)
                 
                 # Remove automation indicators
@@ -2393,15 +3475,15 @@ if result:
                 options.add_experimental_option('useAutomationExtension', False)
                 
                 # Random user agent
-                options.add_argument(f'--user-agent={random.choice(self.user_agents)}')
+                options.add_argument(f'--user-agent={next(self._ua_cycle)}')
                 
                 # Add proxy if available
                 if self.proxies:
-                    proxy = random.choice(self.proxies)
+                    proxy = self._rng.choice(self.proxies)
                 
                     # Use Webshare proxy (only proxy type we support now)
                     if 'server' in proxy:
-                        server = proxy['server'].replace('http://', '').replace('https://', '')
+                        server = proxy['server'].removeprefix('http://').removeprefix('https://')
                         options.add_argument(f'--proxy-server={server}')
                         print(f"Using Webshare proxy {server}")
                 driver = uc.Chrome(options=options)
@@ -2417,47 +3499,32 @@ if result:
                 # options.add_argument('--headless')  # Visible browser for debugging
                 
                 # Add the same stealth arguments
-                stealth_args = [
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-web-security',
-                    '--disable-extensions',
-                    '--disable-plugins'
-                ]
-                
-                for arg in stealth_args:
+                for arg in _SELENIUM_BASIC_ARGS:
                     options.add_argument(arg)
                 
                 options.add_experimental_option("excludeSwitches", ["enable-automation"])
                 options.add_experimental_option('useAutomationExtension', False)
-                options.add_argument(f'--user-agent={random.choice(self.user_agents)}')
+                options.add_argument(f'--user-agent={next(self._ua_cycle)}')
                 
                 driver = webdriver.Chrome(options=options)
                 
                 # Basic stealth script
-                basic_stealth = """
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                delete Object.getPrototypeOf(navigator).webdriver;
-                Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-                Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
-                """
-                driver.execute_script(basic_stealth)
+                driver.execute_script(_SELENIUM_BASIC_STEALTH)
             
             # Navigate to page with random delay
-            time.sleep(random.uniform(1, 3))
+            time.sleep(self._rng.uniform(1, 3))
             driver.get(url)
             
             # Wait for page load and handle potential challenges
-            time.sleep(random.uniform(3, 6))
+            time.sleep(self._rng.uniform(3, 6))
             
             # Check for protection challenges and handle them
             challenge_handled = self._handle_protection_challenges(driver)
             if challenge_handled:
-                time.sleep(random.uniform(5, 8))
+                time.sleep(self._rng.uniform(5, 8))
             
             # Additional wait for dynamic content
-            time.sleep(random.uniform(2, 4))
+            time.sleep(self._rng.uniform(2, 4))
             
             # Get page source
             html = driver.page_source
@@ -2482,105 +3549,7 @@ if result:
     
     def _get_advanced_stealth_script(self) -> str:
         """Get advanced stealth script for bypassing detection"""
-        return """
-        // Advanced stealth script for bypassing bot detection
-        
-        // Hide webdriver property more thoroughly
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined,
-        });
-        
-        // Delete webdriver property from prototype
-        delete Object.getPrototypeOf(navigator).webdriver;
-        
-        // Override automation flags
-        Object.defineProperty(navigator, 'permissions', {
-            get: () => ({
-                query: () => Promise.resolve({ state: 'granted' })
-            }),
-        });
-        
-        // Spoof Chrome runtime
-        window.chrome = {
-            app: {
-                isInstalled: false,
-                InstallState: {
-                    DISABLED: 'disabled',
-                    INSTALLED: 'installed',
-                    NOT_INSTALLED: 'not_installed'
-                },
-                RunningState: {
-                    CANNOT_RUN: 'cannot_run',
-                    READY_TO_RUN: 'ready_to_run',
-                    RUNNING: 'running'
-                }
-            },
-            runtime: {
-                onConnect: null,
-                onMessage: null,
-                onStartup: null,
-                onInstalled: null,
-                onSuspend: null,
-                onSuspendCanceled: null,
-                onUpdateAvailable: null,
-                id: 'fake-extension-id'
-            }
-        };
-        
-        // Spoof plugins
-        Object.defineProperty(navigator, 'plugins', {
-            get: () => [1, 2, 3, 4, 5],
-        });
-        
-        // Spoof languages
-        Object.defineProperty(navigator, 'languages', {
-            get: () => ['en-US', 'en'],
-        });
-        
-        // Spoof platform
-        Object.defineProperty(navigator, 'platform', {
-            get: () => 'Win32',
-        });
-        
-        // Mock getParameter function for WebGL
-        const getParameter = WebGLRenderingContext.getParameter;
-        WebGLRenderingContext.prototype.getParameter = function(parameter) {
-            if (parameter === 37445) {
-                return 'Intel Inc.';
-            }
-            if (parameter === 37446) {
-                return 'Intel(R) Iris(TM) Graphics 6100';
-            }
-            return getParameter(parameter);
-        };
-        
-        // Mock getBattery
-        navigator.getBattery = () => Promise.resolve({
-            charging: true,
-            chargingTime: 0,
-            dischargingTime: Infinity,
-            level: 1
-        });
-        
-        // Override Date to be consistent
-        Date.prototype.getTimezoneOffset = () => -new Date().getTimezoneOffset();
-        
-        // Spoof screen properties
-        Object.defineProperty(screen, 'colorDepth', {get: () => 24});
-        Object.defineProperty(screen, 'pixelDepth', {get: () => 24});
-        
-        // Remove automation indicators
-        ['__driver_evaluate', '__webdriver_evaluate', '__selenium_evaluate', '__fxdriver_evaluate', '__driver_unwrapped', '__webdriver_unwrapped', '__selenium_unwrapped', '__fxdriver_unwrapped', '_Selenium_IDE_Recorder', '_selenium', 'calledSelenium', '_WEBDRIVER_ELEM_CACHE', 'ChromeDriverw', 'driver-evaluate', 'webdriver-evaluate', 'selenium-evaluate', 'webdriverCommand', 'webdriver-evaluate-response'].forEach(prop => {
-            delete window[prop];
-        });
-        
-        // Mock notification permission
-        Object.defineProperty(Notification, 'permission', {
-            get: () => 'default'
-        });
-        
-        console.log('Advanced stealth script loaded');
-        """
+        return _SELENIUM_STEALTH_SCRIPT
     
     def _is_protection_page(self, html: str) -> bool:
         """Check if page is a protection/challenge page (NOT marketing popups)"""
@@ -2588,42 +3557,26 @@ if result:
         if len(html) > 100000:
             return False
             
-        # Only detect ACTUAL protection pages, not normal content with these words
-        protection_indicators = [
-            'incapsula incident id', 'imperva', 'cloudflare ray id',
-            'checking your browser before', 'ddos protection by',
-            'please wait while we', 'security check in progress', 
-            'bot detection', 'access denied by',
-            'solve this challenge', 'complete the captcha',
-            'human verification required', 'ray id:',
-            'attention required! cloudflare', 'checking if the site connection is secure',
-            'enable javascript and cookies to continue',
-            'cdn-cgi/challenge-platform'  # More specific cloudflare detection (not just cloudflare.com)
-        ]
-        
-        html_lower = html.lower()
-        detected_protection = []
-        
-        # Only detect if page is clearly a protection page
-        # Ignore "blocked by" unless it's in a protection context
-        for indicator in protection_indicators:
-            if indicator in html_lower:
-                detected_protection.append(indicator)
-        
-        # Additional stricter checks for ambiguous terms
-        if 'blocked by' in html_lower:
-            # Only consider it protection if page is short AND has other protection signs
-            if len(html) < 10000 and any(word in html_lower for word in ['cloudflare', 'ddos', 'security', 'protection']):
-                detected_protection.append('blocked by (protection context)')
-        
+        # Only detect ACTUAL protection pages, not normal content with these
+        # words; the case-insensitive alternation avoids copying the page
+        # with .lower() and scans it once. Matches are lowercased for the
+        # diagnostics list. Ignore "blocked by" unless it's in a protection
+        # context
+        detected_protection = [m.lower() for m in _PROTECTION_SIG_RE.findall(html)]
+
+        # Additional stricter checks for ambiguous terms: only protection if
+        # the page is short AND has other protection signs
+        if len(html) < 10000 and _BLOCKED_BY_RE.search(html) and _BLOCKED_CONTEXT_RE.search(html):
+            detected_protection.append('blocked by (protection context)')
+
         # Only return True if we have strong evidence of protection AND page is reasonably small
         if detected_protection and len(html) < 100000:
             self.analysis_results['protection_detected'].extend(detected_protection)
             print(f"Real protection detected: {', '.join(detected_protection)}")
             return True
-            
+
         # Additional check: if page is very short and contains clear protection keywords
-        if len(html) < 5000 and any(word in html_lower for word in ['access denied', 'forbidden', 'unauthorized']):
+        if len(html) < 5000 and _SHORT_PROTECTION_RE.search(html):
             self.analysis_results['protection_detected'].append('short_protection_page')
             print("Short protection page detected")
             return True
@@ -2635,22 +3588,20 @@ if result:
         try:
             # Wait for potential challenges to appear
             time.sleep(2)
-            
+
+            probe = driver.execute_script(_CHALLENGE_PROBE_JS)
+
             # Check for Cloudflare challenge
-            if "checking your browser" in driver.page_source.lower():
+            if "checking your browser" in probe:
                 print("Detected Cloudflare challenge, waiting...")
                 WebDriverWait(driver, 10).until(
-                    lambda d: "checking your browser" not in d.page_source.lower()
+                    lambda d: "checking your browser" not in d.execute_script(_CHALLENGE_PROBE_JS)
                 )
                 return True
-            
+
             # Check for other challenge patterns
-            challenge_patterns = [
-                "please wait", "loading", "redirecting"
-            ]
-            
-            for pattern in challenge_patterns:
-                if pattern in driver.page_source.lower():
+            for pattern in _CHALLENGE_PATTERNS:
+                if pattern in probe:
                     print(f"Detected challenge pattern: {pattern}")
                     time.sleep(5)
                     return True
@@ -2680,6 +3631,44 @@ if result:
         # If Playwright fails or is not available, fallback to regular fetch_page
         return self.fetch_page(url)
     
+    def _race_fetch(self, url: str, domain: str) -> Optional[str]:
+        """Race the cheap requests path against the Playwright worker.
+
+        On an unknown domain the serial ladder pays the sum of every
+        failing attempt; racing the two most promising fetchers pays only
+        the fastest clean one. Selenium stays out of the race — spawning a
+        driver per speculative attempt costs more than losing the race.
+        Returns the first HTML that passes the protection check, falling
+        back to the requests result (even if blocked, so the caller can
+        still inspect cf-ray markers) or None.
+        """
+        attempts = [('requests', lambda: self._fetch_simple_like_validate(url))]
+        if self.use_playwright:
+            attempts.append(
+                ('playwright',
+                 lambda: self._fetch_playwright_subprocess(url, headless=True)))
+
+        requests_html = None
+        executor = ThreadPoolExecutor(max_workers=len(attempts))
+        try:
+            futures = {executor.submit(fn): name for name, fn in attempts}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    html = future.result()
+                except Exception as e:
+                    print(f"Raced {name} attempt failed: {e}")
+                    continue
+                if html and not self._is_protection_page(html):
+                    print_success(f"SUCCESS with raced {name} approach!")
+                    self.approach_memory.record_successful_approach(domain, name)
+                    return html
+                if name == 'requests':
+                    requests_html = html
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return requests_html
+
     def fetch_page(self, url: str) -> Optional[str]:
         """Fetch page with multiple fallback methods using approach memory"""
         print(f"Fetching: {url}")
@@ -2705,8 +3694,15 @@ if result:
                     print_success(f"SUCCESS with remembered {successful_approach} approach!")
                     return html
         
-        # Try SIMPLE approach first (if not already tried)
-        if successful_approach != 'requests':
+        # No memory for this domain: race requests against the Playwright
+        # worker instead of paying both serially
+        if successful_approach is None and self.use_playwright:
+            html = self._race_fetch(url, domain)
+            if html and not self._is_protection_page(html):
+                return html
+
+        # Try SIMPLE approach first (if not already tried or raced)
+        elif successful_approach != 'requests':
             html = self._fetch_simple_like_validate(url)
             if html:
                 # Check if it's a real protection page (not just containing "blocked by" text)
@@ -2717,7 +3713,7 @@ if result:
                 else:
                     print("Simple approach got protection page, trying other methods...")
                     html = None  # Clear the variable to prevent false CF-RAY detection
-        
+
         # If simple approach got cf-ray protection, try specialized bypass
         if html and 'cf-ray' in html.lower():
             print("CF-RAY protection detected, trying specialized bypass...")
@@ -2779,7 +3775,66 @@ if result:
         
         print_error(f"Failed to fetch {url} with all methods")
         return None
-    
+
+    def fetch_pages(self, urls: List[str], max_concurrency: int = 5) -> Dict[str, Optional[str]]:
+        """Fetch a batch of URLs concurrently with one shared browser.
+
+        Looping fetch_page over catalog links pays Playwright's serial cost
+        per URL; here a single async browser serves the whole batch with a
+        fresh context per URL, bounded by a semaphore, so the batch finishes
+        in roughly the time of its slowest page. URLs the batch misses (or
+        all of them when Playwright is unavailable) fall back to the full
+        fetch_page ladder individually. Returns {url: html or None}.
+        """
+        results: Dict[str, Optional[str]] = {url: None for url in urls}
+        if not urls:
+            return results
+
+        if self.use_playwright:
+            async def _run() -> None:
+                from playwright.async_api import async_playwright
+
+                sem = asyncio.Semaphore(max_concurrency)
+                async with async_playwright() as p:
+                    browser = await p.chromium.launch(
+                        headless=True,
+                        args=list(_FAST_BROWSER_ARGS)
+                    )
+
+                    async def _one(url: str) -> None:
+                        async with sem:
+                            context = None
+                            try:
+                                context = await browser.new_context(
+                                    user_agent=self._rng.choice(_USER_AGENTS),
+                                    viewport=_VIEWPORTS[0]
+                                )
+                                page = await context.new_page()
+                                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                                content = await page.content()
+                                if content and not self._is_protection_page(content):
+                                    results[url] = content
+                            except Exception as e:
+                                _log.debug("Batch fetch failed for %s: %s", url, e)
+                            finally:
+                                if context is not None:
+                                    await context.close()
+
+                    await asyncio.gather(*(_one(url) for url in urls))
+                    await browser.close()
+
+            try:
+                asyncio.run(_run())
+            except Exception as e:
+                print(f"Batch fetch failed, falling back to serial fetches: {e}")
+
+        # Anything the batch missed gets the full per-URL fallback ladder
+        for url in urls:
+            if results[url] is None:
+                results[url] = self.fetch_page(url)
+
+        return results
+
     def analyze_homepage(self) -> Dict[str, Any]:
         """Analyze the homepage structure"""
         print_info("Analyzing homepage...")
@@ -2788,7 +3843,7 @@ if result:
             self.analysis_results['errors'].append("Failed to fetch homepage")
             return {}
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, _HTML_PARSER)
         
         # Save homepage for inspection in html_samples folder
         os.makedirs('html_samples', exist_ok=True)
@@ -2814,11 +3869,9 @@ if result:
         platform_indicators = self._detect_ecommerce_platform(html, soup)
         site_info['platform_indicators'] = platform_indicators
         
-        # Find navigation and catalog links
-        nav_links = self._find_navigation_links(soup)
+        # Find navigation and catalog links in a single DOM pass
+        nav_links, catalog_links = self._scan_homepage_links(soup)
         site_info['navigation_links'] = nav_links[:20]  # Limit to first 20
-        
-        catalog_links = self._find_catalog_links(soup)
         site_info['potential_catalog_links'] = catalog_links[:10]  # Limit to first 10
         
         self.analysis_results['site_info'] = site_info
@@ -2829,80 +3882,42 @@ if result:
     
     def _detect_ecommerce_platform(self, html: str, soup: BeautifulSoup) -> List[str]:
         """Detect e-commerce platform"""
-        indicators = []
-        html_lower = html.lower()
-        
-        platform_patterns = {
-            'shopify': ['shopify', 'myshopify.com', 'shopifycdn.com', '__st ='],
-            'woocommerce': ['woocommerce', 'wp-content/plugins/woocommerce'],
-            'magento': ['magento', 'mage/', 'var FORM_KEY'],
-            'bigcommerce': ['bigcommerce', 'cdn.bcapp.dev'],
-            'prestashop': ['prestashop', 'ps_'],
-            'opencart': ['index.php?route=', 'catalog/view/theme/'],
-            'squarespace': ['squarespace.com', 'static1.squarespace.com'],
-            'wix': ['wix.com', 'static.wixstatic.com']
-        }
-        
-        for platform, patterns in platform_patterns.items():
-            for pattern in patterns:
-                if pattern in html_lower:
-                    indicators.append(platform)
-                    break
-        
-        return indicators
-    
-    def _find_navigation_links(self, soup: BeautifulSoup) -> List[Dict]:
-        """Find navigation links"""
-        nav_links = []
-        
-        # Look for navigation elements
-        nav_selectors = [
-            'nav a', 'header a', '.navigation a', '.nav a',
-            '.menu a', '.navbar a', '#navigation a', '#nav a'
-        ]
-        
-        for selector in nav_selectors:
-            try:
-                links = soup.select(selector)
-                for link in links:
-                    href = link.get('href', '')
-                    text = link.get_text(strip=True)
-                    if href and text:
-                        nav_links.append({
-                            'href': href,
-                            'text': text,
-                            'classes': link.get('class', [])
-                        })
-            except Exception:
-                continue
-        
-        return nav_links
+        found = {m.lastgroup for m in _PLATFORM_RE.finditer(html)}
+        return [platform for platform in _PLATFORM_PATTERNS if platform in found]
     
-    def _find_catalog_links(self, soup: BeautifulSoup) -> List[Dict]:
-        """Find potential catalog/category links"""
-        catalog_links = []
-        
-        # Keywords that indicate product categories
-        catalog_keywords = [
-            'product', 'category', 'catalog', 'shop', 'store',
-            'collection', 'browse', 'taxonomy', 'department'
-        ]
-        
-        all_links = soup.find_all('a', href=True)
-        
-        for link in all_links:
-            href = link.get('href', '').lower()
-            text = link.get_text(strip=True).lower()
-            
-            # Check if link contains catalog keywords
-            if any(keyword in href or keyword in text for keyword in catalog_keywords):
+    def _scan_homepage_links(self, soup: BeautifulSoup) -> Tuple[List[Dict], List[Dict]]:
+        """Classify every anchor into nav and catalog buckets in one pass.
+
+        The old per-selector and per-keyword helpers each re-walked the
+        full tree (eight CSS selects plus a find_all), so a large homepage
+        was traversed nine times; one find_all with an ancestor check
+        covers both classifications.
+        """
+        nav_links: List[Dict] = []
+        catalog_links: List[Dict] = []
+
+        for link in soup.find_all('a', href=True):
+            href = link.get('href', '')
+            text = link.get_text(strip=True)
+
+            if href and text and _is_nav_anchor(link):
+                nav_links.append({
+                    'href': href,
+                    'text': text,
+                    'classes': link.get('class', [])
+                })
+
+            href_lower = href.lower()
+            text_lower = text.lower()
+            if any(keyword in href_lower or keyword in text_lower
+                   for keyword in _CATALOG_KEYWORDS):
                 catalog_links.append({
-                    'href': link.get('href'),
-                    'text': link.get_text(strip=True),
+                    'href': href,
+                    'text': text,
                     'classes': link.get('class', [])
                 })
-        
-        return catalog_links
+
+        return nav_links, catalog_links
     
     def analyze_catalog_page(self, catalog_url: str = None) -> Dict[str, Any]:
         """Analyze a catalog/category page"""
@@ -2923,7 +3938,7 @@ if result:
             self.analysis_results['errors'].append(f"Failed to fetch catalog page: {catalog_url}")
             return {}
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, _HTML_PARSER)
         
         # Save catalog page for inspection in html_samples folder
         os.makedirs('html_samples', exist_ok=True)
@@ -3014,7 +4029,7 @@ if result:
                         # Extract examples for the AI pattern
                         ai_examples = []
                         try:
-                            soup_temp = BeautifulSoup(html, 'html.parser')
+                            soup_temp = BeautifulSoup(html, _HTML_PARSER)
                             ai_links = soup_temp.select(ai_pattern['selector'])[:5]
                             for link in ai_links:
                                 ai_examples.append({
@@ -3044,9 +4059,16 @@ if result:
         all_links = soup.find_all('a', href=True)
         
         # Also look for links within product container divs (common in modern sites)
+        # One pass over candidate containers with their class strings precomputed;
+        # the per-class lambda scans re-joined and re-lowercased every element's
+        # classes once per class name
         product_container_classes = ['product', 'item', 'listing', 'card', 'tile', 'grid-item', 'product-item', 'product-card']
+        candidate_containers = [
+            (el, ' '.join(el.get('class') or ()).lower())
+            for el in soup.find_all(['div', 'article', 'section'])
+        ]
         for class_name in product_container_classes:
-            containers = soup.find_all(['div', 'article', 'section'], class_=lambda x: x and any(cls in ' '.join(x).lower() for cls in [class_name]))
+            containers = [el for el, class_str in candidate_containers if class_name in class_str]
             for container in containers:
                 container_links = container.find_all('a', href=True)
                 # Add container context to these links
@@ -3412,7 +4434,7 @@ if result:
     def _test_selector_on_page(self, selector: str, html: str) -> int:
         """Test a CSS selector on the actual page HTML to get real count"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _HTML_PARSER)
             elements = soup.select(selector)
             return len(elements)
         except Exception as e:
@@ -3422,7 +4444,7 @@ if result:
     def _test_selector_with_samples(self, selector: str, html: str, base_url: str = "") -> tuple:
         """Test a CSS selector and return count + sample URLs"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _HTML_PARSER)
             elements = soup.select(selector)
             count = len(elements)
             
@@ -3788,7 +4810,7 @@ if result:
             self.analysis_results['errors'].append(f"Failed to fetch product page: {product_url}")
             return {}
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, _HTML_PARSER)
         
         # Save product page for inspection in html_samples folder
         os.makedirs('html_samples', exist_ok=True)
@@ -3952,7 +4974,7 @@ if result:
                     
                     # Priority 0: For Product_Title, try HTML structure first (most reliable)
                     if our_field == 'Product_Title':
-                        soup = BeautifulSoup(html, 'html.parser')
+                        soup = BeautifulSoup(html, _HTML_PARSER)
                         # Look for H1 with product-related classes
                         h1_elements = soup.find_all('h1')
                         for h1 in h1_elements:
@@ -4514,7 +5536,7 @@ if result:
         patterns = {}
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _HTML_PARSER)
             script_tags = soup.find_all('script')
             
             field_mapping = {
@@ -4597,14 +5619,20 @@ if result:
         patterns = {}
         
         try:
-            # Find all script tags with type="application/ld+json"
-            soup = BeautifulSoup(html, 'html.parser')
-            json_scripts = soup.find_all('script', type='application/ld+json')
-            
-            for script in json_scripts:
+            # Stream the ld+json payloads with lxml's incremental parser when
+            # possible; otherwise fall back to a full soup parse
+            payloads = _iter_json_ld_payloads(html)
+            if payloads is None:
+                soup = BeautifulSoup(html, _HTML_PARSER)
+                payloads = []
+                for script in soup.find_all('script', type='application/ld+json'):
+                    try:
+                        payloads.append(json.loads(script.string))
+                    except (json.JSONDecodeError, TypeError):
+                        continue
+
+            for data in payloads:
                 try:
-                    data = json.loads(script.string)
-                    
                     # Handle different JSON-LD structures
                     if isinstance(data, list):
                         for item in data:
@@ -5273,6 +6301,8 @@ if result:
             if '<div' in element_html and element_html.count('<div') > 1:
                 return self._generate_context_aware_pattern(element_html, field_name)
             
+            # Fragments stay on html.parser: lxml wraps them in a
+            # synthetic html/body document, which would shift the root
             soup = BeautifulSoup(element_html, 'html.parser')
             
             # Find the element containing the actual data
@@ -5626,16 +6656,20 @@ if result:
                 print("No HTML provided. Cannot generate configuration.")
                 return {}
                 
-            # Generate patterns from the provided HTML
+            # Generate link and field patterns from the provided HTML. The
+            # two passes are independent (each may spend seconds in an AI
+            # improvement round trip), so run them side by side.
             print("\nGenerating patterns from your HTML element...")
-            generated_patterns = self._generate_patterns_from_html(user_html)
-            
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                link_future = pool.submit(self._generate_patterns_from_html, user_html)
+                field_future = pool.submit(self._extract_field_patterns_from_html, user_html)
+                generated_patterns = link_future.result()
+                field_patterns = field_future.result()
+
             if generated_patterns:
                 self.analysis_results['product_patterns'] = generated_patterns
                 print(f"[SUCCESS] Generated {len(generated_patterns)} product pattern(s)")
-                
-                # Also try to extract field patterns from the same HTML
-                field_patterns = self._extract_field_patterns_from_html(user_html)
+
                 if field_patterns:
                     self.analysis_results['field_patterns'] = field_patterns
                     print(f"[SUCCESS] Generated field patterns for: {', '.join(field_patterns.keys())}")